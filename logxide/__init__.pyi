@@ -44,6 +44,7 @@ class PyLogger:
     def filters(self) -> list: ...
     def setLevel(self, level: LogLevel) -> None: ...
     def getEffectiveLevel(self) -> int: ...
+    def get_cache_state(self) -> tuple[int, str]: ...
     def addHandler(self, handler: Any) -> None: ...
     def removeHandler(self, handler: Any) -> None: ...
     def addFilter(self, filter: Any) -> None: ...
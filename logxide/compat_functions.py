@@ -121,6 +121,13 @@ def captureWarnings(capture):
             _warnings_showwarning = None
 
 
+class _LogRecordCompat:
+    """Plain attribute holder returned by makeLogRecord()."""
+
+    def __init__(self, d):
+        self.__dict__.update(d)
+
+
 def makeLogRecord(dict_):
     """
     Make a LogRecord whose attributes are defined by the specified dictionary.
@@ -135,14 +142,8 @@ def makeLogRecord(dict_):
     Returns:
         A LogRecord-like object (or dict for LogXide compatibility)
     """
-
-    # For LogXide, we can return the dictionary itself or create a simple object
-    # that has the required attributes
-    class LogRecordCompat:
-        def __init__(self, d):
-            self.__dict__.update(d)
-
-    return LogRecordCompat(dict_)
+    # For LogXide, a simple object whose attributes are the dictionary's items
+    return _LogRecordCompat(dict_)
 
 
 # Global log record factory
@@ -6,12 +6,17 @@ Python's standard logging module, but delegates actual logging to
 Rust native handlers for maximum performance.
 """
 
+import atexit
+import collections
 import contextlib
+import math
 import re
 import string
 import sys
+import threading
 import time
 import traceback
+import weakref
 
 NOTSET = 0
 DEBUG = 10
@@ -142,36 +147,83 @@ class Formatter:
         self.style = style
         self.validate = validate
         self._kwargs = kwargs
-        if isinstance(self.fmt, str):
+
+    @property
+    def fmt(self):
+        return self._fmt
+
+    @fmt.setter
+    def fmt(self, value):
+        # Derive the per-format flags here, on assignment, so they follow later
+        # reassignments too. The default format renders the bare message, so
+        # format() can skip the asctime handling and %-interpolation entirely.
+        self._fmt = value
+        self._default_fmt = value == "%(message)s"
+        self._needs_asctime = isinstance(value, str) and "%(asctime)" in value
+        if isinstance(value, str):
             try:
                 from . import logxide
 
-                logxide.logging.activate_caller_info(self.fmt)
+                logxide.logging.activate_caller_info(value)
             except ImportError:
                 pass
 
     def format(self, record):
+        # Rust dispatch hands us plain dicts, user code passes LogRecord-like
+        # objects: pick the path once so neither has to re-check the shape.
         if isinstance(record, dict):
-            record_dict = record.copy()
-        elif hasattr(record, "__dict__"):
-            record_dict = record.__dict__.copy()
-        else:
-            record_dict = {}
+            return self._format_dict(record)
+        return self._format_obj(record)
+
+    def _format_dict(self, record):
+        """Format a record dict built by the Rust dispatch path."""
+        message = record.get("message")
+        if not message:
+            message = record["msg"] if "msg" in record else str(record)
+            if self._default_fmt:
+                return str(message)
+            # Records are formatted in place, like stdlib's Formatter setting
+            # record.message/record.asctime: Rust hands us a fresh dict per
+            # record, so copying it just to inject two keys is wasted work.
+            record["message"] = message
+        elif self._default_fmt:
+            return str(message)
+
+        if self._needs_asctime and "asctime" not in record:
+            record["asctime"] = self.formatTime(record, self.datefmt)
+
+        try:
+            return self.fmt % record
+        except (KeyError, ValueError, TypeError):
+            return record.get("message", str(record))
 
-        if "message" not in record_dict or not record_dict["message"]:
+    def _format_obj(self, record):
+        """Format a LogRecord-like object."""
+        # LogRecords always have a __dict__; only exotic slotted records take the
+        # (zero-cost until raised) except branch.
+        try:
+            record_dict = record.__dict__
+        except AttributeError:
+            record_dict = {}
+        message = record_dict.get("message")
+        if not message:
             if hasattr(record, "getMessage"):
-                record_dict["message"] = record.getMessage()
+                message = record.getMessage()
             elif "msg" in record_dict:
-                record_dict["message"] = record_dict["msg"]
+                message = record_dict["msg"]
             else:
-                record_dict["message"] = getattr(record, "msg", str(record))
-
-        if "asctime" not in record_dict and "%(asctime)" in self.fmt:
+                message = getattr(record, "msg", str(record))
+            if self._default_fmt:
+                return str(message)
+            record_dict["message"] = message
+        elif self._default_fmt:
+            return str(message)
+
+        if self._needs_asctime and "asctime" not in record_dict:
             record_dict["asctime"] = self.formatTime(record, self.datefmt)
 
         try:
-            s = self.fmt % record_dict
-            return s
+            return self.fmt % record_dict
         except (KeyError, ValueError, TypeError):
             return record_dict.get("message", str(record))
 
@@ -187,20 +239,18 @@ class Formatter:
             Formatted time string
         """
         if isinstance(record, dict):
-            ct = record.get("created", time.time())
+            ct = record.get("created")
+            msecs = record.get("msecs", 0)
         else:
-            ct = getattr(record, "created", time.time())
+            ct = getattr(record, "created", None)
+            msecs = getattr(record, "msecs", 0)
+        if ct is None:
+            ct = time.time()
 
         if datefmt:
-            s = time.strftime(datefmt, time.localtime(ct))
+            s = time.strftime(datefmt, _localtime(ct))
         else:
-            t = time.localtime(ct)
-            s = time.strftime("%Y-%m-%d %H:%M:%S", t)
-            if isinstance(record, dict):
-                msecs = record.get("msecs", 0)
-            else:
-                msecs = getattr(record, "msecs", 0)
-            s = f"{s},{int(msecs)}"
+            s = _default_asctime(ct) + _MSEC_STRS[int(msecs) % 1000]
         return s
 
     def formatException(self, ei):
@@ -252,7 +302,28 @@ class Handler:
     def name(self, value):
         self._name = value
 
+    @property
+    def formatter(self):
+        return self._formatter
+
+    @formatter.setter
+    def formatter(self, value):
+        # Resolve the bound format() once here rather than on every record.
+        self._formatter = value
+        self._format_with = value.format if value else None
+
     def handle(self, record):
+        # Rust dispatch calls handle() directly (there is no Logger.callHandlers
+        # level check in between), so honour the handler level here. Handlers
+        # left at NOTSET skip the lookup entirely.
+        level = self.level
+        if level:
+            if isinstance(record, dict):
+                levelno = record.get("levelno", NOTSET)
+            else:
+                levelno = getattr(record, "levelno", NOTSET)
+            if levelno < level:
+                return False
         rv = self.filter(record)
         if rv:
             self.emit(record)
@@ -300,8 +371,9 @@ class Handler:
         self.level = level
 
     def format(self, record):
-        if self.formatter:
-            return self.formatter.format(record)
+        format_with = self._format_with
+        if format_with is not None:
+            return format_with(record)
         else:
             if isinstance(record, dict):
                 return record.get("msg", str(record))
@@ -326,13 +398,33 @@ def getLevelName(level):
 
 
 class StreamHandler(Handler):
-    def __init__(self, stream=None):
+    def __init__(self, stream=None, *, buffer_size=0, flush_interval=5.0):
         super().__init__()
         if stream is None:
             stream = sys.stderr
-        self._stream = stream
-        self._name = None
-        self.terminator = "\n"
+        self.stream = stream
+        # buffer_size > 0 batches output: emit() only queues formatted records and
+        # a writer thread writes them with a single write()/flush() once about
+        # buffer_size characters are pending, or every flush_interval seconds.
+        # ERROR+ records are written synchronously. 0 writes every record.
+        # Fixed at construction: unbuffered handlers skip the queue, lock and
+        # wake-up event entirely.
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._buffered = 0
+        self._writer = None
+        # Set by close() and at interpreter exit: from then on records are
+        # written synchronously, since the writer thread may no longer run.
+        self._dead = False
+        if buffer_size:
+            self._pending = collections.deque()
+            self._write_lock = threading.Lock()
+            self._wake = threading.Event()
+            _buffered_stream_handlers.add(self)
+        else:
+            self._pending = ()
+            self._write_lock = None
+            self._wake = None
 
     @property
     def stream(self):
@@ -341,6 +433,9 @@ class StreamHandler(Handler):
     @stream.setter
     def stream(self, value):
         self._stream = value
+        # Bound once per stream so emit()/flush() skip the attribute lookups.
+        self._stream_write = getattr(value, "write", None)
+        self._stream_flush = getattr(value, "flush", None) if value else None
 
     @property
     def name(self):
@@ -353,29 +448,123 @@ class StreamHandler(Handler):
     def emit(self, record):
         try:
             msg = self.format(record)
-            stream = self.stream
-            stream.write(msg + self.terminator)
+            if self._wake is not None:
+                if not self._dead:
+                    self._emit_buffered(msg + self.terminator, record)
+                    return
+                # The writer thread may still be draining its last batch: write
+                # behind it, and behind anything still queued, under its lock.
+                with self._write_lock:
+                    self._write_pending()
+                    self._stream_write(msg + self.terminator)
+                self._flush_stream()
+                return
+            self._stream_write(msg + self.terminator)
             self.flush()
         except RecursionError:
             raise
         except Exception:
             self.handleError(record)
 
+    def _emit_buffered(self, text, record):
+        # deque.append is atomic, so producers never wait on the writer; the
+        # pending-size counter is only a hint for when to wake it.
+        self._pending.append(text)
+        self._buffered += len(text)
+        if isinstance(record, dict):
+            levelno = record.get("levelno", 0)
+        else:
+            levelno = getattr(record, "levelno", 0)
+        if levelno >= ERROR:
+            self.flush()
+            return
+        if self._writer is None:
+            self._start_writer()
+        if self._buffered >= self.buffer_size:
+            self._wake.set()
+
+    def _start_writer(self):
+        with self._write_lock:
+            if self._writer is not None:
+                return
+            # The thread only holds a weak reference, so an abandoned handler
+            # can still be collected (and its thread then exits).
+            self._writer = threading.Thread(
+                target=_stream_writer_loop,
+                args=(weakref.ref(self), self._wake, self.flush_interval),
+                name="logxide-stream-writer",
+                daemon=True,
+            )
+            self._writer.start()
+
+    def _write_pending(self):
+        """Write out queued records in one call; the caller holds ``_write_lock``."""
+        pending = self._pending
+        if not pending:
+            return
+        parts = []
+        while pending:
+            parts.append(pending.popleft())
+        self._buffered = 0
+        self._stream_write("".join(parts))
+
+    def _flush_stream(self):
+        stream_flush = self._stream_flush
+        if stream_flush is not None:
+            stream_flush()
+
     def flush(self):
-        if self.stream and hasattr(self.stream, "flush"):
-            self.stream.flush()
+        if self._pending:
+            with self._write_lock:
+                self._write_pending()
+        self._flush_stream()
 
     def close(self):
+        self._dead = True
         self.flush()
+        if self._wake is not None:
+            self._wake.set()
 
     def setStream(self, stream):
         if stream is self.stream:
             return None
         old = self.stream
+        # Pending buffered records belong to the old stream.
+        self.flush()
         self.stream = stream
         return old
 
 
+def _stream_writer_loop(handler_ref, wake, interval):
+    while True:
+        wake.wait(interval)
+        wake.clear()
+        handler = handler_ref()
+        if handler is None:
+            return
+        try:
+            handler.flush()
+        except Exception:
+            handler.handleError(None)
+        if handler._dead:
+            return
+        del handler
+
+
+# Buffered StreamHandlers still holding records at interpreter exit get flushed
+# here, so a short-lived process does not lose its last partial batch, and
+# switch to synchronous writes for anything logged later during shutdown.
+_buffered_stream_handlers = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_buffered_stream_handlers():
+    for handler in list(_buffered_stream_handlers):
+        handler._dead = True
+        with contextlib.suppress(Exception):
+            handler.flush()
+
+
 class FileHandler(Handler):
     """File handler class - compatibility wrapper
 
@@ -447,9 +636,12 @@ class LoggingManager:
 
 
 class Filter:
+    __slots__ = ("name", "nlen", "_prefix")
+
     def __init__(self, name=""):
         self.name = name
         self.nlen = len(name)
+        self._prefix = name + "."
 
     def filter(self, record):
         if self.nlen == 0:
@@ -458,7 +650,7 @@ class Filter:
             record_name = record.get("name", "")
         else:
             record_name = getattr(record, "name", "")
-        return bool(self.name == record_name or record_name.startswith(self.name + "."))
+        return record_name == self.name or record_name.startswith(self._prefix)
 
 
 class LogRecord:
@@ -529,6 +721,41 @@ class LogRecord:
 
 _start_time = time.time()
 
+# ",000" .. ",999": formatTime's millisecond suffix becomes a tuple index instead of
+# a per-record str.format call (matches stdlib's default_msec_format "%s,%03d").
+_MSEC_STRS = tuple(f",{i:03d}" for i in range(1000))
+
+# (second, struct_time) of the last localtime() conversion. Records arrive in
+# bursts within the same second, so formatTime usually reuses it; rebinding the
+# tuple is atomic under the GIL, so threads can share it without a lock.
+_localtime_cache = (None, None)
+
+
+def _localtime(ct):
+    global _localtime_cache
+    sec = math.floor(ct)
+    cached_sec, cached_tm = _localtime_cache
+    if cached_sec != sec:
+        cached_tm = time.localtime(sec)
+        _localtime_cache = (sec, cached_tm)
+    return cached_tm
+
+
+# (second, text) of the last default-format timestamp, shared the same way, so
+# same-second records skip strftime too and only the millisecond suffix changes.
+_asctime_cache = (None, None)
+
+
+def _default_asctime(ct):
+    global _asctime_cache
+    sec = math.floor(ct)
+    cached_sec, cached_text = _asctime_cache
+    if cached_sec != sec:
+        cached_text = time.strftime("%Y-%m-%d %H:%M:%S", _localtime(ct))
+        _asctime_cache = (sec, cached_text)
+    return cached_text
+
+
 _level_to_name = {
     CRITICAL: "CRITICAL",
     ERROR: "ERROR",
@@ -544,6 +771,8 @@ class LoggerAdapter:
     information in logging output.
     """
 
+    __slots__ = ("logger", "extra", "merge_extra")
+
     def __init__(self, logger, extra=None, merge_extra=False):
         self.logger = logger
         self.extra = extra
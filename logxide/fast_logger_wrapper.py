@@ -13,6 +13,13 @@ This prevents the overhead of:
 For disabled log calls, this provides a 2-5x speedup.
 """
 
+import sys
+
+from . import logxide as _ext
+
+# Bumped by the Rust side whenever any logger's effective level changes.
+_level_generation = _ext.logging.level_generation
+
 # Log level constants
 DEBUG = 10
 INFO = 20
@@ -33,7 +40,16 @@ class FastLoggerWrapper:
     For enabled log levels, it delegates to the underlying Rust logger.
     """
 
-    __slots__ = ("_rust_logger", "_effective_level", "_name")
+    __slots__ = (
+        "_rust_logger",
+        "_effective_level",
+        "_name",
+        "_generation",
+        "_handlers",
+        "_parent",
+        "_propagate",
+        "_disabled",
+    )
 
     def __init__(self, rust_logger):
         """
@@ -43,19 +59,51 @@ class FastLoggerWrapper:
             rust_logger: The underlying Rust PyLogger instance
         """
         self._rust_logger = rust_logger
-        self._effective_level: int = 0  # Will be updated by _update_cache()
-        self._name = None
-        self._update_cache()
+        # Read the generation first, as in _update_cache().
+        self._generation = _level_generation()
+        level, name = rust_logger.get_cache_state()
+        self._effective_level: int = level
+        # A logger's name never changes, so it is interned once here rather
+        # than on every cache refresh.
+        self._name = sys.intern(name)
+        self._mirror_attributes()
 
     def _update_cache(self):
         """Update cached effective level from Rust logger."""
-        try:
-            self._effective_level = self._rust_logger.getEffectiveLevel()
-            self._name = self._rust_logger.name
-        except Exception:
-            # Fallback to safe defaults
-            self._effective_level = WARNING
-            self._name = "root"
+        # No fallback: a failure here would otherwise leave level filtering
+        # silently wrong, so let it propagate.
+        # Read the generation first: a level change racing with this refresh
+        # then shows up as a mismatch on the next call instead of being lost.
+        self._generation = _level_generation()
+        self._effective_level = self._rust_logger.get_cache_state()[0]
+
+    def _mirror_attributes(self):
+        """Copy the attributes callers probe most often out of the Rust logger."""
+        rust_logger = self._rust_logger
+        self._handlers = rust_logger.handlers
+        self._parent = rust_logger.parent
+        self._propagate = rust_logger.propagate
+        self._disabled = rust_logger.disabled
+
+    @property
+    def handlers(self):
+        """Handlers attached to the logger (cached)."""
+        return self._handlers
+
+    @property
+    def parent(self):
+        """Parent logger (cached)."""
+        return self._parent
+
+    @property
+    def propagate(self):
+        """Whether records propagate to the parent logger (cached)."""
+        return self._propagate
+
+    @property
+    def disabled(self):
+        """Whether the logger is disabled (cached)."""
+        return self._disabled
 
     def _is_enabled_for(self, level: int) -> bool:
         """
@@ -67,26 +115,31 @@ class FastLoggerWrapper:
         Returns:
             True if the level is enabled, False otherwise
         """
-        # Use cached effective level for fast check
-        if self._effective_level == 0:
+        if self._generation != _level_generation():
             self._update_cache()
         return level >= self._effective_level
 
     def debug(self, msg, *args, **kwargs):
         """Log a debug message (optimized fast path for disabled logs)."""
-        if not self._is_enabled_for(DEBUG):
+        if self._generation != _level_generation():
+            self._update_cache()
+        if self._effective_level > DEBUG:
             return
         return self._rust_logger.debug(msg, *args, **kwargs)
 
     def info(self, msg, *args, **kwargs):
         """Log an info message (optimized fast path for disabled logs)."""
-        if not self._is_enabled_for(INFO):
+        if self._generation != _level_generation():
+            self._update_cache()
+        if self._effective_level > INFO:
             return
         return self._rust_logger.info(msg, *args, **kwargs)
 
     def warning(self, msg, *args, **kwargs):
         """Log a warning message (optimized fast path for disabled logs)."""
-        if not self._is_enabled_for(WARNING):
+        if self._generation != _level_generation():
+            self._update_cache()
+        if self._effective_level > WARNING:
             return
         return self._rust_logger.warning(msg, *args, **kwargs)
 
@@ -96,13 +149,17 @@ class FastLoggerWrapper:
 
     def error(self, msg, *args, **kwargs):
         """Log an error message (optimized fast path for disabled logs)."""
-        if not self._is_enabled_for(ERROR):
+        if self._generation != _level_generation():
+            self._update_cache()
+        if self._effective_level > ERROR:
             return
         return self._rust_logger.error(msg, *args, **kwargs)
 
     def critical(self, msg, *args, **kwargs):
         """Log a critical message (optimized fast path for disabled logs)."""
-        if not self._is_enabled_for(CRITICAL):
+        if self._generation != _level_generation():
+            self._update_cache()
+        if self._effective_level > CRITICAL:
             return
         return self._rust_logger.critical(msg, *args, **kwargs)
 
@@ -117,7 +174,9 @@ class FastLoggerWrapper:
         This is typically called from an exception handler, so exc_info
         defaults to True to capture the current exception.
         """
-        if not self._is_enabled_for(ERROR):
+        if self._generation != _level_generation():
+            self._update_cache()
+        if self._effective_level > ERROR:
             return
         # exception() method in Rust requires Python GIL context
         # We need to call it directly without kwargs manipulation
@@ -134,12 +193,36 @@ class FastLoggerWrapper:
             **kwargs: Additional keyword arguments
         """
         if isinstance(level, str):
-            level = _name_to_level.get(level.upper(), WARNING)
-
-        if not self._is_enabled_for(level):
+            # Callers almost always pass the canonical upper-case name; only pay
+            # for .upper() when the exact key misses.
+            resolved = _name_to_level.get(level)
+            if resolved is None:
+                resolved = _name_to_level.get(level.upper(), WARNING)
+            level = resolved
+
+        if self._generation != _level_generation():
+            self._update_cache()
+        if level < self._effective_level:
             return
         return self._rust_logger.log(level, msg, *args, **kwargs)
 
+    def log_if(self, level, factory):
+        """
+        Log the message returned by ``factory`` only if ``level`` is enabled.
+
+        Use this when building the message is expensive: the factory is not
+        called at all for disabled levels, so nothing is allocated for it.
+
+        Args:
+            level: Numeric log level
+            factory: Zero-argument callable returning the message
+        """
+        if self._generation != _level_generation():
+            self._update_cache()
+        if level < self._effective_level:
+            return
+        return self._rust_logger.log(level, factory())
+
     def setLevel(self, level):
         """
         Set the logging level and update cached effective level.
@@ -165,7 +248,7 @@ class FastLoggerWrapper:
 
     def getEffectiveLevel(self):
         """Get the effective logging level."""
-        if self._effective_level is None:
+        if self._generation != _level_generation():
             self._update_cache()
         return self._effective_level
 
@@ -173,12 +256,14 @@ class FastLoggerWrapper:
         """Add a handler to the logger and invalidate cache."""
         result = self._rust_logger.addHandler(handler)
         self._update_cache()
+        self._mirror_attributes()
         return result
 
     def removeHandler(self, handler):
         """Remove a handler from the logger and invalidate cache."""
         result = self._rust_logger.removeHandler(handler)
         self._update_cache()
+        self._mirror_attributes()
         return result
 
     # Delegate all other attributes to the underlying Rust logger
@@ -195,13 +280,15 @@ class FastLoggerWrapper:
         """
         Handle attribute setting, updating cache when needed.
         """
-        if name in ("_rust_logger", "_effective_level", "_name"):
+        if name in FastLoggerWrapper.__slots__:
             object.__setattr__(self, name, value)
         else:
             setattr(self._rust_logger, name, value)
             # If we're setting something that might affect level, update cache
             if name in ("level", "parent", "propagate"):
                 self._update_cache()
+            if name in ("handlers", "parent", "propagate", "disabled"):
+                self._mirror_attributes()
 
     def __repr__(self):
         """Return string representation."""
@@ -3,8 +3,10 @@ Compatibility handlers for LogXide.
 """
 
 import contextlib
+import io
 import logging
 import logging.handlers
+import os
 import sys
 
 from . import logxide
@@ -52,6 +54,40 @@ def _translatable(fmt):
     return (True, fmt_str, getattr(fmt, "datefmt", None))
 
 
+# LogRecord attributes _prepare_record_for_rust() maps explicitly; anything else
+# on the record is forwarded as an extra.
+_STANDARD_RECORD_FIELDS = frozenset(
+    {
+        "name",
+        "levelno",
+        "levelname",
+        "pathname",
+        "filename",
+        "module",
+        "lineno",
+        "funcName",
+        "func_name",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "relative_created",
+        "thread",
+        "threadName",
+        "thread_name",
+        "process",
+        "processName",
+        "process_name",
+        "msg",
+        "message",
+        "args",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "task_name",
+    }
+)
+
+
 def _prepare_record_for_rust(record, native=False):
     # Rust expects an instance of the logxide.logging.LogRecord pyclass.
     # We construct a native Rust-backed LogRecord and populate its fields.
@@ -107,52 +143,87 @@ def _prepare_record_for_rust(record, native=False):
     rust_record.levelname = getattr(record, "levelname", "")
 
     # Extract extra attributes to the Rust LogRecord's extra dictionary
-    standard_fields = {
-        "name",
-        "levelno",
-        "levelname",
-        "pathname",
-        "filename",
-        "module",
-        "lineno",
-        "funcName",
-        "func_name",
-        "created",
-        "msecs",
-        "relativeCreated",
-        "relative_created",
-        "thread",
-        "threadName",
-        "thread_name",
-        "process",
-        "processName",
-        "process_name",
-        "msg",
-        "message",
-        "args",
-        "exc_info",
-        "exc_text",
-        "stack_info",
-        "task_name",
-    }
     for key, value in record.__dict__.items():
-        if key not in standard_fields:
+        if key not in _STANDARD_RECORD_FIELDS:
             setattr(rust_record, key, value)
 
     return rust_record
 
 
-class FileHandler(logging.FileHandler):
-    def __init__(self, filename, mode="a", encoding=None, delay=False, errors=None):
-        # Initialize inner handler first (before parent creates file handle)
-        self._inner = logxide.FileHandler(filename)
-        self._native = True
-        super().__init__(filename, mode, encoding, delay, errors)
-        # Close parent's file handle since we use Rust handler
-        if hasattr(self, "stream") and self.stream:
-            self.stream.close()
-            self.stream = None
-        self._recompute_native()
+def _init_file_attributes(handler, filename, mode, encoding, delay, errors):
+    """Set the attributes logging.FileHandler.__init__ would, without opening the file.
+
+    The Rust inner handler owns the file, so running the stdlib constructor would
+    only open a second descriptor for us to close straight away.
+    """
+    logging.Handler.__init__(handler)
+    handler.baseFilename = os.path.abspath(filename)
+    handler.mode = mode
+    if "b" not in mode:
+        encoding = io.text_encoding(encoding)
+    handler.encoding = encoding
+    handler.errors = errors
+    handler.delay = delay
+    handler.stream = None
+
+
+class _InnerDelegate:
+    """Mirror stdlib handler state onto the Rust handler held in ``self._inner``."""
+
+    def __getattr__(self, name):
+        # Only reached for names neither the shim nor its stdlib base defines:
+        # expose the Rust handler's own methods (isNative, getRecords, ...).
+        # Bound methods are cached on the instance so the next lookup is a plain
+        # __dict__ hit; other values (properties) stay live.
+        if name == "_inner":
+            raise AttributeError(name)
+        attr = getattr(self._inner, name)
+        if callable(attr):
+            self.__dict__[name] = attr
+        return attr
+
+    def setLevel(self, level):
+        super().setLevel(level)
+        self._inner.setLevel(level)
+
+    def _to_rust_record(self, record):
+        if self.formatter:
+            record.msg = self.format(record)
+            record.args = None
+        return _prepare_record_for_rust(record)
+
+    def batch_emit(self, records):
+        """
+        Hand several records to the Rust handler in one call.
+
+        Each record is level-checked and filtered as handle() would; records that
+        fail to convert go to handleError() and are left out of the batch.
+        """
+        batch = []
+        level = self.level
+        for record in records:
+            if record.levelno < level:
+                continue
+            rv = self.filter(record)
+            if not rv:
+                continue
+            if isinstance(rv, logging.LogRecord):
+                record = rv
+            try:
+                batch.append(self._to_rust_record(record))
+            except Exception:
+                self.handleError(record)
+        if batch:
+            self._inner.batch_emit(batch)
+
+
+class _NativeTextSink(_InnerDelegate):
+    """Shared plumbing for the text-sink shims (file, rotating file, stream).
+
+    Records are rendered by the Rust formatter while the Python formatter can be
+    translated and no filters are attached; otherwise they are formatted in
+    Python and handed over pre-rendered.
+    """
 
     def _recompute_native(self):
         ok, fmt_str, datefmt = _translatable(self.formatter)
@@ -163,10 +234,6 @@ class FileHandler(logging.FileHandler):
             self._inner.setPythonDispatch()
             self._native = False
 
-    def setLevel(self, level):
-        super().setLevel(level)
-        self._inner.setLevel(level)
-
     def setFormatter(self, fmt):
         super().setFormatter(fmt)
         self._recompute_native()
@@ -179,18 +246,27 @@ class FileHandler(logging.FileHandler):
         super().removeFilter(filter)
         self._recompute_native()
 
+    def _to_rust_record(self, record):
+        if self._native:
+            return _prepare_record_for_rust(record, native=True)
+        return super()._to_rust_record(record)
+
     def emit(self, record):
         try:
-            if self._native:
-                self._inner.emit(_prepare_record_for_rust(record, native=True))
-            else:
-                if self.formatter:
-                    record.msg = self.format(record)
-                    record.args = None
-                self._inner.emit(_prepare_record_for_rust(record))
+            self._inner.emit(self._to_rust_record(record))
         except Exception:
             self.handleError(record)
 
+    def setErrorCallback(self, callback):
+        """
+        Set error callback for write failures.
+        """
+        self._inner.setErrorCallback(callback)
+
+
+class _NativeFileSink(_NativeTextSink):
+    """File-backed text sinks: buffered in Rust, flushed by level or on demand."""
+
     def setFlushLevel(self, level):
         """
         Set the flush level. Records at or above this level trigger immediate flush.
@@ -204,70 +280,36 @@ class FileHandler(logging.FileHandler):
         """
         return self._inner.getFlushLevel()
 
-    def setErrorCallback(self, callback):
-        """
-        Set error callback for write failures.
-        """
-        self._inner.setErrorCallback(callback)
-
     def flush(self):
         """Flush the handler."""
         self._inner.flush()
 
 
-class StreamHandler(logging.StreamHandler):
-    def __init__(self, stream=None):
-        target = "stdout" if stream is sys.stdout else "stderr"
-        self._inner = logxide.StreamHandler(target)
+class FileHandler(_NativeFileSink, logging.FileHandler):
+    def __init__(self, filename, mode="a", encoding=None, delay=False, errors=None):
+        filename = os.fspath(filename)
+        self._inner = logxide.FileHandler(filename)
         self._native = True
-        super().__init__(stream)
-        self._recompute_native()
-
-    def _recompute_native(self):
-        ok, fmt_str, datefmt = _translatable(self.formatter)
-        if ok and not self.filters:
-            self._inner.setFormatterSpec(fmt_str, datefmt)
-            self._native = True
-        else:
-            self._inner.setPythonDispatch()
-            self._native = False
-
-    def setLevel(self, level):
-        super().setLevel(level)
-        self._inner.setLevel(level)
-
-    def setFormatter(self, fmt):
-        super().setFormatter(fmt)
+        _init_file_attributes(self, filename, mode, encoding, delay, errors)
         self._recompute_native()
 
-    def addFilter(self, filter):
-        super().addFilter(filter)
-        self._recompute_native()
 
-    def removeFilter(self, filter):
-        super().removeFilter(filter)
+class StreamHandler(_NativeTextSink, logging.StreamHandler):
+    def __init__(self, stream=None):
+        if stream is None:
+            stream = sys.stderr
+        self._inner = logxide.StreamHandler(
+            "stdout" if stream is sys.stdout else "stderr"
+        )
+        self._native = True
+        # All logging.StreamHandler.__init__ adds on top of Handler is the
+        # stream default and assignment above, so set it up directly.
+        logging.Handler.__init__(self)
+        self.stream = stream
         self._recompute_native()
 
-    def emit(self, record):
-        try:
-            if self._native:
-                self._inner.emit(_prepare_record_for_rust(record, native=True))
-            else:
-                if self.formatter:
-                    record.msg = self.format(record)
-                    record.args = None
-                self._inner.emit(_prepare_record_for_rust(record))
-        except Exception:
-            self.handleError(record)
-
-    def setErrorCallback(self, callback):
-        """
-        Set error callback for write failures.
-        """
-        self._inner.setErrorCallback(callback)
-
 
-class RotatingFileHandler(logging.handlers.RotatingFileHandler):
+class RotatingFileHandler(_NativeFileSink, logging.handlers.RotatingFileHandler):
     def __init__(
         self,
         filename,
@@ -278,78 +320,21 @@ class RotatingFileHandler(logging.handlers.RotatingFileHandler):
         delay=False,
         errors=None,
     ):
-        # Initialize inner handler first (before parent creates file handle)
+        filename = os.fspath(filename)
         self._inner = logxide.RotatingFileHandler(filename, maxBytes, backupCount)
         self._native = True
-        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay)
-        # Close parent's file handle since we use Rust handler
-        if hasattr(self, "stream") and self.stream:
-            self.stream.close()
-            self.stream = None
+        # Like stdlib: rotation only makes sense when appending.
+        if maxBytes > 0:
+            mode = "a"
+        _init_file_attributes(self, filename, mode, encoding, delay, errors)
+        self.namer = None
+        self.rotator = None
+        self.maxBytes = maxBytes
+        self.backupCount = backupCount
         self._recompute_native()
 
-    def _recompute_native(self):
-        ok, fmt_str, datefmt = _translatable(self.formatter)
-        if ok and not self.filters:
-            self._inner.setFormatterSpec(fmt_str, datefmt)
-            self._native = True
-        else:
-            self._inner.setPythonDispatch()
-            self._native = False
-
-    def setLevel(self, level):
-        super().setLevel(level)
-        self._inner.setLevel(level)
-
-    def setFormatter(self, fmt):
-        super().setFormatter(fmt)
-        self._recompute_native()
 
-    def addFilter(self, filter):
-        super().addFilter(filter)
-        self._recompute_native()
-
-    def removeFilter(self, filter):
-        super().removeFilter(filter)
-        self._recompute_native()
-
-    def emit(self, record):
-        try:
-            if self._native:
-                self._inner.emit(_prepare_record_for_rust(record, native=True))
-            else:
-                if self.formatter:
-                    record.msg = self.format(record)
-                    record.args = None
-                self._inner.emit(_prepare_record_for_rust(record))
-        except Exception:
-            self.handleError(record)
-
-    def setFlushLevel(self, level):
-        """
-        Set the flush level. Records at or above this level trigger immediate flush.
-        Default is ERROR (40).
-        """
-        self._inner.setFlushLevel(level)
-
-    def getFlushLevel(self):
-        """
-        Get the current flush level.
-        """
-        return self._inner.getFlushLevel()
-
-    def setErrorCallback(self, callback):
-        """
-        Set error callback for write failures.
-        """
-        self._inner.setErrorCallback(callback)
-
-    def flush(self):
-        """Flush the handler."""
-        self._inner.flush()
-
-
-class HTTPHandler(logging.Handler):
+class HTTPHandler(_InnerDelegate, logging.Handler):
     """
     High-performance HTTP handler with batching and background transmission.
 
@@ -363,6 +348,8 @@ class HTTPHandler(logging.Handler):
         transform_callback: Callable(records) -> transformed_records for custom JSON
         context_provider: Callable() -> dict for dynamic context per batch
         error_callback: Callable(error_msg) for HTTP failure handling
+        tcp_nodelay: Disable Nagle's algorithm on the upload socket (default: True);
+            batches are already coalesced, so delaying them only adds latency
     """
 
     def __init__(
@@ -377,6 +364,7 @@ class HTTPHandler(logging.Handler):
         context_provider=None,
         error_callback=None,
         overflow="block",
+        tcp_nodelay=True,
     ):
         super().__init__()
         self._inner = logxide.HTTPHandler(
@@ -390,19 +378,12 @@ class HTTPHandler(logging.Handler):
             context_provider=context_provider,
             error_callback=error_callback,
             overflow=overflow,
+            tcp_nodelay=tcp_nodelay,
         )
 
-    def setLevel(self, level):
-        super().setLevel(level)
-        self._inner.setLevel(level)
-
     def emit(self, record):
         try:
-            if self.formatter:
-                record.msg = self.format(record)
-                record.args = None
-            rust_record = _prepare_record_for_rust(record)
-            self._inner.emit(rust_record)
+            self._inner.emit(self._to_rust_record(record))
         except Exception:
             self.handleError(record)
 
@@ -441,7 +422,7 @@ class HTTPHandler(logging.Handler):
         return self._inner.getFlushLevel()
 
 
-class OTLPHandler(logging.Handler):
+class OTLPHandler(_InnerDelegate, logging.Handler):
     """
     High-performance OTLP (OpenTelemetry) handler for log export.
 
@@ -449,6 +430,7 @@ class OTLPHandler(logging.Handler):
         url: OTLP endpoint URL (e.g., http://localhost:4318/v1/logs)
         service_name: Service name for OTLP logs
         headers: Optional HTTP headers dict
+        tcp_nodelay: Disable Nagle's algorithm on the upload socket (default: True)
     """
 
     def __init__(
@@ -457,23 +439,20 @@ class OTLPHandler(logging.Handler):
         service_name,
         headers=None,
         overflow="block",
+        tcp_nodelay=True,
     ):
         super().__init__()
         self._inner = logxide.OTLPHandler(
-            url=url, service_name=service_name, headers=headers, overflow=overflow
+            url=url,
+            service_name=service_name,
+            headers=headers,
+            overflow=overflow,
+            tcp_nodelay=tcp_nodelay,
         )
 
-    def setLevel(self, level):
-        super().setLevel(level)
-        self._inner.setLevel(level)
-
     def emit(self, record):
         try:
-            if self.formatter:
-                record.msg = self.format(record)
-                record.args = None
-            rust_record = _prepare_record_for_rust(record)
-            self._inner.emit(rust_record)
+            self._inner.emit(self._to_rust_record(record))
         except Exception:
             self.handleError(record)
 
@@ -493,7 +472,7 @@ class OTLPHandler(logging.Handler):
         return self._inner.get_metrics()
 
 
-class MemoryHandler(logging.Handler):
+class MemoryHandler(_InnerDelegate, logging.Handler):
     """
     High-performance memory handler for testing and log capture.
     Stores records in Rust native memory for maximum performance.
@@ -502,20 +481,29 @@ class MemoryHandler(logging.Handler):
     - `.records`: List of LogRecord objects
     - `.text`: All messages joined with newlines
     - `.record_tuples`: List of (logger_name, level, message) tuples
+
+    Args:
+        capacity: Keep at most this many records, dropping the oldest once full
+            (default: None, unbounded). Must be at least 1.
     """
 
-    def __init__(self):
+    def __init__(self, capacity=None):
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
         super().__init__()
-        self._inner = logxide.MemoryHandler()
+        self._inner = logxide.MemoryHandler(capacity)
+        # (version, value) pairs: .text and .record_tuples are re-read by every
+        # assertion, so only rebuild them once new records have arrived.
+        self._text_cache = None
+        self._tuples_cache = None
 
-    def setLevel(self, level):
-        super().setLevel(level)
-        self._inner.setLevel(level)
+    def _to_rust_record(self, record):
+        # MemoryHandler is always native: forward raw; caplog reads _inner.
+        return _prepare_record_for_rust(record, native=True)
 
     def emit(self, record):
         try:
-            # MemoryHandler is always native: forward raw; caplog reads _inner.
-            self._inner.emit(_prepare_record_for_rust(record, native=True))
+            self._inner.emit(self._to_rust_record(record))
         except Exception:
             self.handleError(record)
 
@@ -546,7 +534,12 @@ class MemoryHandler(logging.Handler):
         Returns:
             str: All messages joined with newlines.
         """
-        return self._inner.text
+        inner = self._inner
+        version = inner.version
+        cached = self._text_cache
+        if cached is None or cached[0] != version:
+            cached = self._text_cache = (version, inner.text)
+        return cached[1]
 
     @property
     def record_tuples(self):
@@ -558,7 +551,13 @@ class MemoryHandler(logging.Handler):
         Returns:
             List of (logger_name, level_number, message) tuples.
         """
-        return self._inner.record_tuples
+        inner = self._inner
+        version = inner.version
+        cached = self._tuples_cache
+        if cached is None or cached[0] != version:
+            cached = self._tuples_cache = (version, inner.record_tuples)
+        # A fresh list each time, so callers mutating it cannot corrupt the cache.
+        return list(cached[1])
 
     def clear(self):
         """Clear all captured records."""
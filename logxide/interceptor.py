@@ -8,6 +8,7 @@ hardcode standard logging usage.
 """
 
 import contextlib
+import functools
 import logging
 import threading
 
@@ -16,6 +17,17 @@ from . import logger_wrapper
 _local = threading.local()
 
 
+@functools.lru_cache(maxsize=1024)
+def _log_methods(name):
+    """Return the (isEnabledFor, log) bound methods of LogXide logger ``name``.
+
+    Bounded so applications that put request IDs or similar in logger names
+    don't grow the cache without limit.
+    """
+    logger = logger_wrapper.getLogger(name)
+    return logger.isEnabledFor, logger.log
+
+
 class InterceptHandler(logging.Handler):
     """
     Standard library logging handler that intercepts all logs and
@@ -32,10 +44,12 @@ class InterceptHandler(logging.Handler):
             traceback.print_stack()
             return
 
-        _local.in_interceptor = True
         _local.in_interceptor = True
         try:
-            logger = logger_wrapper.getLogger(record.name)
+            is_enabled_for, log = _log_methods(record.name)
+            # Records the LogXide logger would drop skip message formatting.
+            if not is_enabled_for(record.levelno):
+                return
 
             try:
                 message = record.getMessage()
@@ -47,7 +61,7 @@ class InterceptHandler(logging.Handler):
                 kwargs["exc_info"] = record.exc_info
 
             with contextlib.suppress(Exception):
-                logger.log(record.levelno, message, **kwargs)
+                log(record.levelno, message, **kwargs)
         finally:
             _local.in_interceptor = False
 
@@ -6,6 +6,10 @@ including configuration management and logger migration.
 """
 
 import contextlib
+import logging as _std_logging
+
+from .compat_functions import _nameToLevel
+from .compat_handlers import ERROR
 
 # Import the Rust extension module directly
 try:
@@ -26,7 +30,15 @@ except ImportError:
 _existing_logger_registry = {}
 
 # Track the current LogXide configuration to apply to new loggers
-_current_config = {"level": None, "format": None, "datefmt": None}
+_current_config = {
+    "level": None,
+    "format": None,
+    "datefmt": None,
+}
+
+# Buffering defaults for the file handler basicConfig(filename=...) registers
+_DEFAULT_FLUSH_LEVEL = ERROR
+_DEFAULT_FLUSH_INTERVAL_MS = 30_000
 
 # Track whether basicConfig has been called to prevent duplicate handlers
 _basic_config_called = False
@@ -43,6 +55,10 @@ def basicConfig(**kwargs):
     - stream: Stream to write log output to (sys.stdout or sys.stderr supported)
     - filename: Log to a file instead of a stream
     - force: If True, remove any existing handlers and reconfigure (default: False)
+    - flush_level: With filename, records at or above this level (number or
+      name) flush the file immediately (default: ERROR)
+    - flush_interval_ms: With filename, flush buffered output at least this often
+      so quiet periods don't leave records unwritten (default: 30000; 0 disables)
 
     Note: LogXide uses Rust native handlers for performance. All handler
     configuration is done through this function. Direct handler registration
@@ -70,52 +86,48 @@ def basicConfig(**kwargs):
 
     _basic_config_called = True
 
-    # Store configuration for applying to new loggers
-    _current_config["level"] = kwargs.get("level")
-    _current_config["format"] = kwargs.get("format")
-    _current_config["datefmt"] = kwargs.get("datefmt")
-
-    # Get configuration parameters
-    level = kwargs.get("level", 10)  # Default to DEBUG (10)
-    stream = kwargs.get("stream")
-    filename = kwargs.get("filename")
+    # Read each option once; the raw values (None when not given) are what new
+    # loggers are configured from.
+    get = kwargs.get
+    raw_level = get("level")
+    fmt = get("format")
+    datefmt = get("datefmt")
+    flush_level = get("flush_level")
+    flush_interval_ms = get("flush_interval_ms")
+    _current_config.update(level=raw_level, format=fmt, datefmt=datefmt)
 
-    # Get format parameters
-    fmt = kwargs.get("format")
-    datefmt = kwargs.get("datefmt")
+    # Default to DEBUG (10). The Rust handlers take numeric levels only.
+    level = 10 if raw_level is None else _level_number(raw_level)
+    filename = get("filename")
 
     # Register appropriate Rust native handler
     if filename:
-        # File handler
-        logxide_module.logging.register_file_handler(filename, level, fmt, datefmt)
+        # File handler: buffered in Rust, flushed by level and on a timer
+        logxide_module.logging.register_file_handler(
+            filename,
+            level,
+            fmt,
+            datefmt,
+            flush_level=_level_number(
+                _DEFAULT_FLUSH_LEVEL if flush_level is None else flush_level
+            ),
+            flush_interval_ms=(
+                _DEFAULT_FLUSH_INTERVAL_MS
+                if flush_interval_ms is None
+                else flush_interval_ms
+            ),
+        )
     else:
-        # Stream handler (stdout, stderr, or Python object like StringIO)
-        if stream is None:
-            # Default to stderr
-            logxide_module.logging.register_stream_handler(
-                "stderr",
-                level,
-                fmt,
-                datefmt,
-            )
+        # Stream handler: stdout/stderr by name, any other file-like object
+        # (StringIO, open file, ...) is passed to Rust as-is.
+        stream = get("stream")
+        if stream is None or stream is sys.stderr:
+            target = "stderr"
         elif stream is sys.stdout:
-            logxide_module.logging.register_stream_handler(
-                "stdout",
-                level,
-                fmt,
-                datefmt,
-            )
-        elif stream is sys.stderr:
-            logxide_module.logging.register_stream_handler(
-                "stderr",
-                level,
-                fmt,
-                datefmt,
-            )
+            target = "stdout"
         else:
-            # Python file-like object (StringIO, file, etc.)
-            # Pass the Python object directly to Rust
-            logxide_module.logging.register_stream_handler(stream, level, fmt, datefmt)
+            target = stream
+        logxide_module.logging.register_stream_handler(target, level, fmt, datefmt)
 
     # Set root logger level
     root_logger = getLogger()
@@ -123,7 +135,7 @@ def basicConfig(**kwargs):
         root_logger.setLevel(level)
 
     # Now handle existing Python loggers that were created before LogXide
-    _migrate_existing_loggers()
+    _migrate_existing_loggers(force=force)
 
     # Explicitly reconfigure uvicorn loggers to ensure they propagate to LogXide's root
     # This is a targeted fix for uvicorn's aggressive logging setup.
@@ -131,49 +143,108 @@ def basicConfig(**kwargs):
         uvicorn_logger = getLogger(logger_name)
         if uvicorn_logger:
             with contextlib.suppress(AttributeError):
-                uvicorn_logger.handlers.clear()
-                uvicorn_logger.propagate = True
+                _rebind_logger(uvicorn_logger)
+
+
+def _level_number(level):
+    """Resolve a level name such as ``"ERROR"`` to its number; numbers pass through."""
+    if isinstance(level, str):
+        try:
+            return _nameToLevel[level.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown level: {level!r}") from None
+    return level
 
 
-def _migrate_existing_loggers():
+def _rebind_logger(logger):
+    """Route ``logger`` to LogXide's root: no handlers of its own, propagating.
+
+    Only writes what differs, so loggers that are already set up cost two reads.
+    """
+    handlers = logger.handlers
+    if handlers:
+        handlers.clear()
+    if not logger.propagate:
+        logger.propagate = True
+
+
+def _migrate_existing_loggers(force=False):
     """
     Discover existing Python loggers and ensure getLogger returns LogXide loggers.
     This handles cases where libraries create loggers before LogXide is configured.
-    """
-    import logging as std_logging
 
+    Loggers migrated by an earlier call are skipped unless ``force`` is True, so
+    repeated calls only visit loggers created since the last one.
+    """
     # Access Python's standard logger registry
-    if hasattr(std_logging.Logger, "manager") and hasattr(
-        std_logging.Logger.manager, "loggerDict"
-    ):
-        logger_dict = std_logging.Logger.manager.loggerDict
+    logger_cls = _std_logging.Logger
+    if hasattr(logger_cls, "manager") and hasattr(logger_cls.manager, "loggerDict"):
+        logger_dict = logger_cls.manager.loggerDict
+
+        if force:
+            names = list(logger_dict)
+        else:
+            names = logger_dict.keys() - _existing_logger_registry.keys()
 
         # For each existing logger, register it in our tracking registry
-        for logger_name, logger_obj in logger_dict.items():
-            if isinstance(logger_obj, std_logging.Logger):
+        for logger_name in names:
+            logger_obj = logger_dict.get(logger_name)
+            if isinstance(logger_obj, logger_cls):
                 # Ensure existing loggers use LogXide's root logger
-                logger_obj.handlers.clear()  # Remove any existing handlers
-                logger_obj.propagate = True  # Let messages go to root
+                _rebind_logger(logger_obj)
                 _existing_logger_registry[logger_name] = True
 
 
 # Track loggers to ensure we return singleton instances
 _logger_cache = {}
 
+# The root logger, once created: getLogger() without a name returns it directly.
+_root_logger = None
 
-def getLogger(name=None):
+
+def getLogger(name=None, _cached=_logger_cache.get):
     """
     Get a logger by name, ensuring existing loggers get LogXide functionality.
     """
+    # Called for every logging.getLogger(__name__); once a name is cached this
+    # is a single dict lookup (bound as a default to skip the global lookups).
     if name is None:
+        logger = _root_logger
+        if logger is not None:
+            return logger
         name = "root"
+    logger = _cached(name)
+    if logger is not None:
+        return logger
+    return _create_logger(name)
+
 
-    if name in _logger_cache:
-        return _logger_cache[name]
+def _create_logger(name):
+    """Create, configure and cache the logger for ``name`` (cache miss path)."""
+    if not name or name == "root":
+        return _new_logger(name, None)
+
+    # Walk the dotted prefixes top-down in one pass, creating whichever
+    # ancestors are missing and linking each one to the previous.
+    parent = _logger_cache.get("root") or _new_logger("root", None)
+    prefix = None
+    for part in name.split("."):
+        prefix = part if prefix is None else f"{prefix}.{part}"
+        logger = _logger_cache.get(prefix)
+        if logger is None:
+            logger = _new_logger(prefix, parent)
+        parent = logger
+    return parent
+
+
+def _new_logger(name, parent):
+    global _root_logger
 
     # Get the LogXide logger
     logger = _rust_getLogger(name)
     _logger_cache[name] = logger
+    if name == "root":
+        _root_logger = logger
 
     # Ensure any retrieved logger propagates to the root and has no other handlers
     # logger.handlers.clear() # Handlers are managed by the Rust side now
@@ -184,14 +255,8 @@ def getLogger(name=None):
         with contextlib.suppress(AttributeError):
             logger.setLevel(_current_config["level"])
 
-    # Set parent for non-root loggers
-    if name and "." in name:
-        parent_name = name.rsplit(".", 1)[0]
-        parent_logger = getLogger(parent_name)
-        with contextlib.suppress(AttributeError):
-            logger.parent = parent_logger
-    elif name and name != "root":
+    if parent is not None:
         with contextlib.suppress(AttributeError):
-            logger.parent = getLogger("root")
+            logger.parent = parent
 
     return logger
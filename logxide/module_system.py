@@ -79,6 +79,10 @@ from .logger_wrapper import _migrate_existing_loggers, basicConfig, getLogger
 
 def _auto_configure_sentry(enable=None):
     """Automatically configure Sentry integration if available."""
+    # sentry_sdk.init() imports sentry_sdk, so until something has imported it
+    # there is no client to detect; don't pay for importing it just to check.
+    if enable is None and "sentry_sdk" not in sys.modules:
+        return
     try:
         from .sentry_integration import auto_configure_sentry
 
@@ -106,6 +110,15 @@ set_thread_name_fn = logxide.logging.set_thread_name
 PyLogger = logxide.logging.PyLogger
 
 
+# Private attributes of the stdlib logging module that some libraries touch,
+# mapped to the factory that builds each one.
+_LAZY_INTERNALS = {
+    "_lock": threading.RLock,
+    "_handlers": weakref.WeakValueDictionary,
+    "_handlerList": list,
+}
+
+
 class _LoggingModule(types.ModuleType):
     """
     Compatibility module that mirrors the standard logging module interface.
@@ -150,11 +163,6 @@ class _LoggingModule(types.ModuleType):
         self._STYLES = _STYLES
         self.BASIC_FORMAT = BASIC_FORMAT
 
-        self._lock, self._handlers, self._handlerList = (
-            threading.RLock(),
-            weakref.WeakValueDictionary(),
-            [],
-        )
         self.root = _std_logging.root
 
         from . import logxide as _ext
@@ -164,14 +172,24 @@ class _LoggingModule(types.ModuleType):
         self.HTTPHandler = _ext.HTTPHandler
         self.OTLPHandler = _ext.OTLPHandler
         self.lastResort, self.raiseExceptions = _std_logging.lastResort, True
+        # The native functions themselves, not wrapper methods: logging.flush()
+        # is one call into Rust.
+        self.flush, self.set_thread_name = flush_fn, set_thread_name_fn
 
         import logging.config
         import logging.handlers
 
         self.config, self.handlers = logging.config, logging.handlers
 
+    def __getattr__(self, name):
+        # Stdlib-private handler bookkeeping, created on first access only.
+        factory = _LAZY_INTERNALS.get(name)
+        if factory is None:
+            raise AttributeError(f"module 'logging' has no attribute {name!r}")
+        return self.__dict__.setdefault(name, factory())
+
     def getLogger(self, name=None):
-        if not hasattr(_std_logging, "_original_getLogger"):
+        if not _installed:
             _install()
         # Return the patched logger from standard logging
         return _std_logging.getLogger(name)
@@ -179,12 +197,6 @@ class _LoggingModule(types.ModuleType):
     def basicConfig(self, **kwargs):
         return basicConfig(**kwargs)
 
-    def flush(self):
-        return flush_fn()
-
-    def set_thread_name(self, name):
-        return set_thread_name_fn(name)
-
     addLevelName = staticmethod(addLevelName)
     getLevelName = staticmethod(getLevelName)
     disable = staticmethod(disable)
@@ -198,32 +210,51 @@ class _LoggingModule(types.ModuleType):
     getHandlerByName = staticmethod(getHandlerByName)
     getHandlerNames = staticmethod(getHandlerNames)
 
+    def _bind_root_methods(self):
+        """Point the module-level helpers straight at the root logger's methods.
+
+        Instance attributes shadow the methods below, so after the first call
+        logging.info(...) and friends skip the getLogger() lookup entirely.
+        """
+        root = self.getLogger()
+        for name in ("debug", "info", "warning", "error", "critical", "exception"):
+            setattr(self, name, getattr(root, name))
+        self.log = root.log
+        self.warn = root.warning
+        self.fatal = root.critical
+        return root
+
+    def _unbind_root_methods(self):
+        """Drop the helpers bound by _bind_root_methods; the next call rebinds."""
+        for name in _ROOT_METHODS:
+            self.__dict__.pop(name, None)
+
     def debug(self, msg, *args, **kwargs):
-        self.getLogger().debug(msg, *args, **kwargs)
+        self._bind_root_methods().debug(msg, *args, **kwargs)
 
     def info(self, msg, *args, **kwargs):
-        self.getLogger().info(msg, *args, **kwargs)
+        self._bind_root_methods().info(msg, *args, **kwargs)
 
     def warning(self, msg, *args, **kwargs):
-        self.getLogger().warning(msg, *args, **kwargs)
+        self._bind_root_methods().warning(msg, *args, **kwargs)
 
     def warn(self, msg, *args, **kwargs):
-        self.getLogger().warning(msg, *args, **kwargs)
+        self._bind_root_methods().warning(msg, *args, **kwargs)
 
     def error(self, msg, *args, **kwargs):
-        self.getLogger().error(msg, *args, **kwargs)
+        self._bind_root_methods().error(msg, *args, **kwargs)
 
     def critical(self, msg, *args, **kwargs):
-        self.getLogger().critical(msg, *args, **kwargs)
+        self._bind_root_methods().critical(msg, *args, **kwargs)
 
     def exception(self, msg, *args, **kwargs):
-        self.getLogger().exception(msg, *args, **kwargs)
+        self._bind_root_methods().exception(msg, *args, **kwargs)
 
     def log(self, level, msg, *args, **kwargs):
-        self.getLogger().log(level, msg, *args, **kwargs)
+        self._bind_root_methods().log(level, msg, *args, **kwargs)
 
     def fatal(self, msg, *args, **kwargs):
-        self.getLogger().critical(msg, *args, **kwargs)
+        self._bind_root_methods().critical(msg, *args, **kwargs)
 
     def shutdown(self):
         """Cleanly shutdown the logging system."""
@@ -233,25 +264,77 @@ class _LoggingModule(types.ModuleType):
                 h.flush()
 
 
+# Module-level helpers _bind_root_methods() binds to the root logger.
+_ROOT_METHODS = (
+    "debug",
+    "info",
+    "warning",
+    "error",
+    "critical",
+    "exception",
+    "log",
+    "warn",
+    "fatal",
+)
+
 # Create the singleton instance
 logging = _LoggingModule()
 
+# Set by _install() and cleared by uninstall(); checked on every
+# logging.getLogger() call instead of probing the stdlib module's attributes.
+_installed = False
+
+
+# Stdlib loggers already patched by logging.getLogger(), by name; cleared by
+# uninstall().
+_patched_loggers = {}
+
+# Logging methods a stdlib logger forwards to its LogXide counterpart.
+_FORWARDED_METHODS = (
+    "debug",
+    "info",
+    "warning",
+    "error",
+    "critical",
+    "exception",
+    "log",
+    "fatal",
+    "warn",
+)
+
 
 def _install(sentry=None):
     """
     Install LogXide patches into the standard logging module.
     """
-    import logging as std_logging
-
-    if hasattr(std_logging, "_logxide_installed"):
+    global _installed
+    if _installed:
         return
-    std_logging._logxide_installed = True
-
-    if not hasattr(std_logging, "_original_getLogger"):
-        std_logging._original_getLogger = std_logging.getLogger
-
-    def logxide_getLogger(name=None):
-        std_logger = std_logging._original_getLogger(name)
+    _installed = True
+    logging._unbind_root_methods()
+    # Patched by an earlier import of this module (e.g. after a reload): the
+    # stdlib functions saved below would be our own wrappers.
+    if hasattr(_std_logging, "_logxide_installed"):
+        return
+    _std_logging._logxide_installed = True
+
+    _std_logging._original_getLogger = _std_logging.getLogger
+
+    def logxide_getLogger(name=None, _cached=_patched_loggers.get):
+        # Already patched: skip the stdlib lookup (and its module lock), unless
+        # the logger has since been unwrapped or dropped from the registry.
+        std_logger = _cached(name)
+        if std_logger is not None:
+            root = _std_logging.root
+            if not name or name == root.name:
+                registered = root
+            else:
+                registered = root.manager.loggerDict.get(name)
+            if registered is std_logger and "_logxide_pylogger" in std_logger.__dict__:
+                return std_logger
+            _patched_loggers.pop(name, None)
+
+        std_logger = _std_logging._original_getLogger(name)
         if (
             "pytest" in sys.modules
             and name
@@ -260,25 +343,16 @@ def _install(sentry=None):
             return std_logger
 
         if hasattr(std_logger, "_logxide_pylogger"):
+            _patched_loggers[name] = std_logger
             return std_logger
 
         logxide_logger = getLogger(name)
         std_logger._logxide_pylogger = logxide_logger
 
-        methods = [
-            "debug",
-            "info",
-            "warning",
-            "error",
-            "critical",
-            "exception",
-            "log",
-            "fatal",
-            "warn",
-        ]
-        for m in methods:
-            if hasattr(logxide_logger, m):
-                setattr(std_logger, m, getattr(logxide_logger, m))
+        for m in _FORWARDED_METHODS:
+            method = getattr(logxide_logger, m, None)
+            if method is not None:
+                setattr(std_logger, m, method)
 
         original_setLevel = std_logger.setLevel
 
@@ -326,37 +400,40 @@ def _install(sentry=None):
 
         std_logger.removeFilter = wrapped_removeFilter
 
+        _patched_loggers[name] = std_logger
         return std_logger
 
-    std_logging.getLogger = logxide_getLogger
+    _std_logging.getLogger = logxide_getLogger
 
-    if not hasattr(std_logging, "_original_basicConfig"):
-        std_logging._original_basicConfig = std_logging.basicConfig
+    _std_logging._original_basicConfig = _std_logging.basicConfig
 
     def logxide_basicConfig(**kwargs):
         with contextlib.suppress(Exception):
-            std_logging._original_basicConfig(**kwargs)
+            _std_logging._original_basicConfig(**kwargs)
         return basicConfig(**kwargs)
 
-    std_logging.basicConfig = logxide_basicConfig
+    _std_logging.basicConfig = logxide_basicConfig
 
-    if not hasattr(std_logging, "flush"):
-        std_logging.flush = flush_fn
-    if not hasattr(std_logging, "set_thread_name"):
-        std_logging.set_thread_name = set_thread_name_fn
+    if not hasattr(_std_logging, "flush"):
+        _std_logging.flush = flush_fn
+    if not hasattr(_std_logging, "set_thread_name"):
+        _std_logging.set_thread_name = set_thread_name_fn
 
     _migrate_existing_loggers()
-    _auto_configure_sentry()
+    _auto_configure_sentry(sentry)
 
 
 def uninstall():
-    import logging as std_logging
-
-    if hasattr(std_logging, "_original_getLogger"):
-        std_logging.getLogger = std_logging._original_getLogger
-        delattr(std_logging, "_original_getLogger")
-    if hasattr(std_logging, "_original_basicConfig"):
-        std_logging.basicConfig = std_logging._original_basicConfig
-        delattr(std_logging, "_original_basicConfig")
-    if hasattr(std_logging, "_logxide_installed"):
-        delattr(std_logging, "_logxide_installed")
+    global _installed
+    _installed = False
+    _patched_loggers.clear()
+    logging._unbind_root_methods()
+
+    if hasattr(_std_logging, "_original_getLogger"):
+        _std_logging.getLogger = _std_logging._original_getLogger
+        delattr(_std_logging, "_original_getLogger")
+    if hasattr(_std_logging, "_original_basicConfig"):
+        _std_logging.basicConfig = _std_logging._original_basicConfig
+        delattr(_std_logging, "_original_basicConfig")
+    if hasattr(_std_logging, "_logxide_installed"):
+        delattr(_std_logging, "_logxide_installed")
@@ -6,11 +6,39 @@ automatically sending log events at WARNING level and above to Sentry
 when it's configured in the project.
 """
 
+import json
 import sys
 from typing import Any, Literal, cast
 
 from .compat_handlers import CRITICAL, ERROR, WARNING, Handler
 
+# LogRecord attributes that are not forwarded to Sentry as custom_* extras.
+_STANDARD_RECORD_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "getMessage",
+    }
+)
+
 
 class SentryHandler(Handler):
     """
@@ -56,6 +84,18 @@ class SentryHandler(Handler):
             # Sentry SDK is not installed
             self._sentry_available = False
 
+    def handle(self, record):
+        """
+        Filter and emit a record without the base class's level gate.
+
+        Records below ``level`` are still needed here: emit() turns them into
+        breadcrumbs.
+        """
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
+
     def emit(self, record) -> None:
         """
         Emit a log record to Sentry.
@@ -221,36 +261,11 @@ class SentryHandler(Handler):
         # Any additional attributes that aren't standard
         if hasattr(record, "__dict__"):
             record_dict = record.__dict__
-            standard_attrs = {
-                "name",
-                "msg",
-                "args",
-                "levelname",
-                "levelno",
-                "pathname",
-                "filename",
-                "module",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "lineno",
-                "funcName",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "processName",
-                "process",
-                "getMessage",
-            }
 
             for key, value in record_dict.items():
-                if key not in standard_attrs and not key.startswith("_"):
+                if key not in _STANDARD_RECORD_ATTRS and not key.startswith("_"):
                     try:
                         # Only include JSON-serializable values
-                        import json
-
                         json.dumps(value)  # Test if serializable
                         extra[f"custom_{key}"] = value
                     except (TypeError, ValueError):
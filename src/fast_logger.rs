@@ -5,7 +5,7 @@
 //! become a bottleneck.
 
 use crate::core::LogLevel;
-use std::sync::atomic::{AtomicBool, AtomicU32, Ordering};
+use std::sync::atomic::{AtomicBool, AtomicU32, AtomicU64, Ordering};
 use std::sync::Arc;
 
 /// Fast logger using atomic operations for lock-free level checking
@@ -36,6 +36,14 @@ impl FastLogger {
             && level as u32 >= self.effective_level.load(Ordering::Relaxed)
     }
 
+    /// Level check on a raw numeric level: one relaxed atomic load, and custom
+    /// levels (e.g. 25) compare by value instead of collapsing to NOTSET.
+    #[inline(always)]
+    pub fn is_enabled_for_level(&self, level: u32) -> bool {
+        !self.disabled.load(Ordering::Relaxed)
+            && level >= self.effective_level.load(Ordering::Relaxed)
+    }
+
     pub fn set_level(&self, level: LogLevel) {
         self.level.store(level as u32, Ordering::Relaxed);
         self.update_effective_level();
@@ -151,6 +159,10 @@ impl FastLoggerManager {
             };
             logger.effective_level.store(effective, Ordering::Relaxed);
         }
+
+        // Publish after the stores so a reader that sees the new generation
+        // also sees the new effective levels.
+        LEVEL_GENERATION.fetch_add(1, Ordering::Release);
     }
 
     /// Walk up the parent chain to find the nearest ancestor with a non-NOTSET level.
@@ -179,6 +191,12 @@ impl FastLoggerManager {
 /// Global fast logger manager instance
 static FAST_LOGGER_MANAGER: Lazy<FastLoggerManager> = Lazy::new(FastLoggerManager::new);
 
+/// Bumped every time effective levels are recomputed, so Python-side level
+/// caches can tell when they are stale without re-reading every logger.
+/// Only `propagate_effective_levels` bumps it, so any code that changes a
+/// logger's level must finish by calling it (as `PyLogger.setLevel` does).
+static LEVEL_GENERATION: AtomicU64 = AtomicU64::new(0);
+
 pub fn get_fast_logger(name: &str) -> Arc<FastLogger> {
     FAST_LOGGER_MANAGER.get_logger(name)
 }
@@ -192,3 +210,8 @@ pub fn get_fast_root_logger() -> Arc<FastLogger> {
 pub fn propagate_all_effective_levels() {
     FAST_LOGGER_MANAGER.propagate_effective_levels();
 }
+
+/// Current effective-level generation (see `LEVEL_GENERATION`).
+pub fn level_generation() -> u64 {
+    LEVEL_GENERATION.load(Ordering::Acquire)
+}
@@ -82,6 +82,12 @@ pub fn format_string_needs_caller(format_str: &str) -> bool {
         || format_str.contains("%(func_name)")
 }
 
+/// Generation counter bumped on every effective-level change, for Python-side caches
+#[pyfunction]
+pub fn level_generation() -> u64 {
+    fast_logger::level_generation()
+}
+
 /// Expose caller-info activation to Python compatibility layer
 #[pyfunction]
 pub fn activate_caller_info(format_str: &str) {
@@ -126,12 +132,14 @@ pub fn get_logger(
     py: Python,
     name: Option<&str>,
     manager: Option<Py<PyAny>>,
-) -> PyResult<PyLogger> {
+) -> PyResult<Py<PyLogger>> {
     let logger_name = name.unwrap_or("root");
 
+    // Hand back the registered object itself: repeat lookups allocate nothing and
+    // getLogger(name) is getLogger(name), as with stdlib logging.
     let mut alive = PY_LOGGER_KEEP_ALIVE.lock().unwrap();
     if let Some(p) = alive.get(logger_name) {
-        return Ok(p.bind(py).borrow().clone());
+        return Ok(p.clone_ref(py));
     }
 
     let inner = if name.is_some() {
@@ -148,7 +156,7 @@ pub fn get_logger(
     let p = Py::new(py, pylogger)?;
     alive.insert(logger_name.to_string(), p.clone_ref(py));
 
-    Ok(p.bind(py).borrow().clone())
+    Ok(p)
 }
 
 #[pyfunction]
@@ -226,20 +234,27 @@ pub fn clear_handlers(py: Python) -> PyResult<()> {
 }
 
 #[pyfunction(name = "register_file_handler")]
-#[pyo3(signature = (filename, level=None, format=None, datefmt=None))]
+#[pyo3(signature = (filename, level=None, format=None, datefmt=None, flush_level=None, flush_interval_ms=None))]
 pub fn register_file_handler(
     _py: Python,
     filename: String,
     level: Option<u32>,
     format: Option<String>,
     datefmt: Option<String>,
+    flush_level: Option<u32>,
+    flush_interval_ms: Option<u64>,
 ) -> PyResult<()> {
     use pyo3::exceptions::PyValueError;
 
     let log_level = LogLevel::from_usize(level.unwrap_or(10) as usize);
 
-    let handler = FileHandler::new(filename)
-        .map_err(|e| PyValueError::new_err(format!("Failed to create file handler: {e}")))?;
+    let handler = match flush_interval_ms.filter(|&ms| ms > 0) {
+        Some(ms) => {
+            FileHandler::with_periodic_flush(filename, std::time::Duration::from_millis(ms))
+        }
+        None => FileHandler::new(filename).map(Arc::new),
+    }
+    .map_err(|e| PyValueError::new_err(format!("Failed to create file handler: {e}")))?;
 
     handler.set_level(log_level);
 
@@ -253,7 +268,11 @@ pub fn register_file_handler(
         handler.set_formatter_instance(Arc::new(formatter));
     }
 
-    push_handler(Arc::new(handler));
+    if let Some(flush_level) = flush_level {
+        handler.set_flush_level(LogLevel::from_usize(flush_level as usize));
+    }
+
+    push_handler(handler);
     Ok(())
 }
 
@@ -6,7 +6,7 @@
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
 use serde_json::Value;
-use std::collections::HashMap;
+use std::collections::{HashMap, VecDeque};
 use std::fs::{File, OpenOptions};
 use std::io::{BufWriter, Write};
 use std::path::{Path, PathBuf};
@@ -294,6 +294,15 @@ impl Handler for StreamHandler {
 // FileHandler — synchronous direct file write
 // ============================================================================
 
+/// Write buffer for a FileHandler with a periodic flush. Records below the flush
+/// level only reach the file once this much output is pending, on flush() or on
+/// the next timer tick, so a larger buffer means fewer write syscalls for
+/// high-volume logs. Handlers without a timer keep BufWriter's default size.
+const FILE_BUFFER_CAPACITY: usize = 64 * 1024;
+
+/// Periodic flush interval for file handlers created from Python directly.
+pub const DEFAULT_FILE_FLUSH_INTERVAL: Duration = Duration::from_secs(1);
+
 pub struct FileHandler {
     writer: parking_lot::Mutex<BufWriter<File>>,
     level: AtomicU8,
@@ -305,13 +314,33 @@ pub struct FileHandler {
 impl FileHandler {
     pub fn new<P: AsRef<Path>>(path: P) -> std::io::Result<Self> {
         let f = OpenOptions::new().create(true).append(true).open(path)?;
-        Ok(Self {
-            writer: parking_lot::Mutex::new(BufWriter::new(f)),
+        Ok(Self::from_writer(BufWriter::new(f)))
+    }
+
+    /// Create a handler with the larger write buffer, flushed every `interval`
+    /// by a background thread. The two go together: without the timer, records
+    /// below the flush level could sit in the buffer indefinitely.
+    pub fn with_periodic_flush<P: AsRef<Path>>(
+        path: P,
+        interval: Duration,
+    ) -> std::io::Result<Arc<Self>> {
+        let f = OpenOptions::new().create(true).append(true).open(path)?;
+        let handler = Arc::new(Self::from_writer(BufWriter::with_capacity(
+            FILE_BUFFER_CAPACITY,
+            f,
+        )));
+        handler.spawn_periodic_flush(interval);
+        Ok(handler)
+    }
+
+    fn from_writer(writer: BufWriter<File>) -> Self {
+        Self {
+            writer: parking_lot::Mutex::new(writer),
             level: AtomicU8::new(LogLevel::Debug as u8),
             flush_level: AtomicU8::new(LogLevel::Error as u8),
             dispatch_mode: AtomicU8::new(DispatchMode::Native as u8),
             formatter: parking_lot::Mutex::new(default_formatter()),
-        })
+        }
     }
 
     pub fn set_level(&self, level: LogLevel) {
@@ -329,6 +358,22 @@ impl FileHandler {
         self.flush_level.load(Ordering::Relaxed)
     }
 
+    /// Flush the write buffer every `interval` from a background thread, so
+    /// records below the flush level reach the file within a bounded delay even
+    /// when logging goes quiet. The thread exits once the handler is dropped.
+    fn spawn_periodic_flush(self: &Arc<Self>, interval: Duration) {
+        let handler = Arc::downgrade(self);
+        let _ = std::thread::Builder::new()
+            .name("logxide-file-flush".into())
+            .spawn(move || loop {
+                std::thread::sleep(interval);
+                match handler.upgrade() {
+                    Some(h) => h.flush(),
+                    None => break,
+                }
+            });
+    }
+
     /// Set an error callback for this handler.
     pub fn set_error_callback(&self, _callback: Option<Arc<dyn Fn(String) + Send + Sync>>) {}
 
@@ -351,7 +396,12 @@ impl Handler for FileHandler {
         }
         let output = self.format_record(record);
         let mut w = self.writer.lock();
-        if let Err(e) = writeln!(w, "{output}") {
+        // Copy the bytes straight into the buffer; writeln! would run the
+        // formatting machinery just to append a newline.
+        if let Err(e) = w
+            .write_all(output.as_bytes())
+            .and_then(|()| w.write_all(b"\n"))
+        {
             eprintln!("[LogXide Error] FileHandler write failed: {e}");
         }
         // Level-based flush: flush if record level >= flush_level
@@ -614,6 +664,8 @@ pub struct HTTPHandlerConfig {
     pub context_provider: Option<Py<PyAny>>,
     pub error_callback: Option<Py<PyAny>>,
     pub overflow: OverflowStrategy,
+    /// Disable Nagle's algorithm on the upload socket (batches are already coalesced).
+    pub tcp_nodelay: bool,
 }
 
 impl HTTPHandler {
@@ -634,6 +686,7 @@ impl HTTPHandler {
                 context_provider: None,
                 error_callback: None,
                 overflow,
+                tcp_nodelay: true,
             },
             capacity,
             batch_size,
@@ -660,6 +713,10 @@ impl HTTPHandler {
         let transform_callback = config.transform_callback;
         let context_provider = config.context_provider;
         let error_callback = config.error_callback;
+        // One agent per handler so the worker reuses its keep-alive connection.
+        let agent = ureq::AgentBuilder::new()
+            .no_delay(config.tcp_nodelay)
+            .build();
 
         let sink_acknowledged = Arc::new(AtomicU64::new(0));
         let delivery_failed = Arc::new(AtomicU64::new(0));
@@ -672,6 +729,7 @@ impl HTTPHandler {
 
             let send = |buffer: &mut Vec<LogRecord>| {
                 Self::send_batch_with_callbacks(
+                    &agent,
                     &url,
                     &headers,
                     &global_context,
@@ -808,6 +866,7 @@ impl HTTPHandler {
     }
 
     fn send_batch_with_callbacks(
+        agent: &ureq::Agent,
         url: &str,
         headers: &HashMap<String, String>,
         global_context: &HashMap<String, Value>,
@@ -877,23 +936,12 @@ impl HTTPHandler {
                         })
                         .collect();
 
-                    let py_records = serde_json::to_string(&records_list).ok().and_then(|s| {
-                        py.import("json")
-                            .ok()
-                            .and_then(|json_mod| json_mod.call_method1("loads", (s,)).ok())
-                    });
-
-                    if let Some(py_recs) = py_records {
+                    // Convert Value <-> Python objects directly: no JSON text round trip
+                    // through Python's json module in either direction.
+                    let records_value = Value::Array(records_list);
+                    if let Ok(py_recs) = crate::core::json_value_to_py_as_list(py, &records_value) {
                         if let Ok(result) = cb.call1(py, (py_recs,)) {
-                            if let Ok(json_mod) = py.import("json") {
-                                if let Ok(json_str) = json_mod.call_method1("dumps", (result,)) {
-                                    if let Ok(s) = json_str.extract::<String>() {
-                                        if let Ok(v) = serde_json::from_str(&s) {
-                                            return v;
-                                        }
-                                    }
-                                }
-                            }
+                            return crate::py_logger::py_to_json_value(result.bind(py));
                         }
                     }
                 }
@@ -918,7 +966,7 @@ impl HTTPHandler {
             })
         };
 
-        let mut request = ureq::post(url).set("Content-Type", "application/json");
+        let mut request = agent.post(url).set("Content-Type", "application/json");
         for (key, value) in headers {
             request = request.set(key, value);
         }
@@ -1045,6 +1093,8 @@ pub struct OTLPHandlerConfig {
     pub service_name: String,
     pub error_callback: Option<Py<PyAny>>,
     pub overflow: OverflowStrategy,
+    /// Disable Nagle's algorithm on the upload socket (batches are already coalesced).
+    pub tcp_nodelay: bool,
 }
 
 impl OTLPHandler {
@@ -1064,6 +1114,7 @@ impl OTLPHandler {
                 service_name,
                 error_callback: None,
                 overflow,
+                tcp_nodelay: true,
             },
             capacity,
             batch_size,
@@ -1088,6 +1139,10 @@ impl OTLPHandler {
         let headers = config.headers;
         let service_name = config.service_name;
         let error_callback = config.error_callback;
+        // One agent per handler so the worker reuses its keep-alive connection.
+        let agent = ureq::AgentBuilder::new()
+            .no_delay(config.tcp_nodelay)
+            .build();
 
         let sink_acknowledged = Arc::new(AtomicU64::new(0));
         let delivery_failed = Arc::new(AtomicU64::new(0));
@@ -1100,6 +1155,7 @@ impl OTLPHandler {
 
             let send = |buffer: &mut Vec<LogRecord>| {
                 Self::send_otlp_batch(
+                    &agent,
                     &url,
                     &headers,
                     &service_name,
@@ -1226,6 +1282,7 @@ impl OTLPHandler {
     }
 
     fn send_otlp_batch(
+        agent: &ureq::Agent,
         url: &str,
         headers: &HashMap<String, String>,
         service_name: &str,
@@ -1316,7 +1373,9 @@ impl OTLPHandler {
 
         let payload = resource_logs.encode_to_vec();
 
-        let mut request = ureq::post(url).set("Content-Type", "application/x-protobuf");
+        let mut request = agent
+            .post(url)
+            .set("Content-Type", "application/x-protobuf");
         for (key, value) in headers {
             request = request.set(key, value);
         }
@@ -1408,24 +1467,39 @@ impl Drop for OTLPHandler {
 /// - `get_records()` - Returns all captured LogRecord objects
 /// - `get_text()` - Returns all captured messages as a single string
 /// - `get_record_tuples()` - Returns (logger_name, level, message) tuples
+///
+/// With a capacity the store is a ring buffer: once full, each new record
+/// evicts the oldest one, so long-running captures stay bounded.
 pub struct MemoryHandler {
-    records: Arc<parking_lot::Mutex<Vec<LogRecord>>>,
+    records: Arc<parking_lot::Mutex<VecDeque<LogRecord>>>,
+    capacity: Option<usize>,
+    /// Bumped whenever the stored records change, so readers can cache views.
+    version: AtomicU64,
     level: AtomicU8,
     formatter: parking_lot::Mutex<Option<Arc<dyn Formatter + Send + Sync>>>,
 }
 
 impl MemoryHandler {
     pub fn new() -> Self {
+        Self::with_capacity(None)
+    }
+
+    /// Create a handler keeping at most `capacity` records (unbounded if `None`).
+    pub fn with_capacity(capacity: Option<usize>) -> Self {
         Self {
-            records: Arc::new(parking_lot::Mutex::new(Vec::new())),
+            records: Arc::new(parking_lot::Mutex::new(VecDeque::with_capacity(
+                capacity.unwrap_or(0),
+            ))),
+            capacity,
+            version: AtomicU64::new(0),
             level: AtomicU8::new(LogLevel::Debug as u8),
             formatter: parking_lot::Mutex::new(None),
         }
     }
 
-    /// Returns all captured log records.
+    /// Returns all captured log records, oldest first.
     pub fn get_records(&self) -> Vec<LogRecord> {
-        self.records.lock().clone()
+        self.records.lock().iter().cloned().collect()
     }
 
     /// Returns all captured log messages as a single newline-separated string.
@@ -1462,6 +1536,12 @@ impl MemoryHandler {
     /// Clear all captured records.
     pub fn clear(&self) {
         self.records.lock().clear();
+        self.version.fetch_add(1, Ordering::Release);
+    }
+
+    /// Counter that changes whenever records are added or cleared.
+    pub fn version(&self) -> u64 {
+        self.version.load(Ordering::Acquire)
     }
 
     pub fn set_level(&self, level: LogLevel) {
@@ -1492,7 +1572,17 @@ impl Handler for MemoryHandler {
         if record.levelno < level as i32 {
             return;
         }
-        self.records.lock().push(record.clone());
+        let mut records = self.records.lock();
+        if let Some(capacity) = self.capacity {
+            if capacity == 0 {
+                return;
+            }
+            if records.len() >= capacity {
+                records.pop_front();
+            }
+        }
+        records.push_back(record.clone());
+        self.version.fetch_add(1, Ordering::Release);
     }
 
     fn flush(&self) {}
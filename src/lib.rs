@@ -59,6 +59,10 @@ fn logxide(_py: Python, m: &Bound<'_, pyo3::types::PyModule>) -> PyResult<()> {
         globals::activate_caller_info,
         &logging_module
     )?)?;
+    logging_module.add_function(wrap_pyfunction!(
+        globals::level_generation,
+        &logging_module
+    )?)?;
     m.add_submodule(&logging_module)?;
 
     m.add_class::<PyLogger>()?;
@@ -84,5 +88,6 @@ fn logxide(_py: Python, m: &Bound<'_, pyo3::types::PyModule>) -> PyResult<()> {
     )?)?;
     m.add_function(wrap_pyfunction!(globals::register_stream_handler, m)?)?;
     m.add_function(wrap_pyfunction!(globals::activate_caller_info, m)?)?;
+    m.add_function(wrap_pyfunction!(globals::level_generation, m)?)?;
     Ok(())
 }
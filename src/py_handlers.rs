@@ -13,6 +13,7 @@ use crate::globals::check_caller_info_needed;
 use crate::handler::{
     DispatchMode, FileHandler, HTTPHandler, HTTPHandlerConfig, Handler, MemoryHandler, OTLPHandler,
     OTLPHandlerConfig, OverflowStrategy, RotatingFileHandler, StreamHandler,
+    DEFAULT_FILE_FLUSH_INTERVAL,
 };
 use crate::py_logger::check_level;
 
@@ -110,8 +111,9 @@ pub struct PyFileHandler {
 impl PyFileHandler {
     #[new]
     fn new(filename: String) -> PyResult<Self> {
-        let h = FileHandler::new(filename).map_err(|e| PyValueError::new_err(e.to_string()))?;
-        Ok(Self { inner: Arc::new(h) })
+        let inner = FileHandler::with_periodic_flush(filename, DEFAULT_FILE_FLUSH_INTERVAL)
+            .map_err(|e| PyValueError::new_err(e.to_string()))?;
+        Ok(Self { inner })
     }
 
     fn setLevel(&self, py: Python, level: &Bound<PyAny>) -> PyResult<()> {
@@ -167,6 +169,15 @@ impl PyFileHandler {
         Ok(())
     }
 
+    /// Emit an iterable of records in a single call across the Python boundary.
+    fn batch_emit(&self, records: &Bound<PyAny>) -> PyResult<()> {
+        for record in records.try_iter()? {
+            let rust_record = record?.extract::<LogRecord>()?;
+            self.inner.emit(&rust_record);
+        }
+        Ok(())
+    }
+
     #[pyo3(name = "setFormatterSpec", signature = (fmt=None, datefmt=None))]
     fn set_formatter_spec(&self, fmt: Option<String>, datefmt: Option<String>) -> PyResult<()> {
         match fmt {
@@ -247,6 +258,15 @@ impl PyStreamHandler {
         Ok(())
     }
 
+    /// Emit an iterable of records in a single call across the Python boundary.
+    fn batch_emit(&self, records: &Bound<PyAny>) -> PyResult<()> {
+        for record in records.try_iter()? {
+            let rust_record = record?.extract::<LogRecord>()?;
+            self.inner.emit(&rust_record);
+        }
+        Ok(())
+    }
+
     #[pyo3(name = "setFormatterSpec", signature = (fmt=None, datefmt=None))]
     fn set_formatter_spec(&self, fmt: Option<String>, datefmt: Option<String>) -> PyResult<()> {
         match fmt {
@@ -344,6 +364,15 @@ impl PyRotatingFileHandler {
         Ok(())
     }
 
+    /// Emit an iterable of records in a single call across the Python boundary.
+    fn batch_emit(&self, records: &Bound<PyAny>) -> PyResult<()> {
+        for record in records.try_iter()? {
+            let rust_record = record?.extract::<LogRecord>()?;
+            self.inner.emit(&rust_record);
+        }
+        Ok(())
+    }
+
     #[pyo3(name = "setFormatterSpec", signature = (fmt=None, datefmt=None))]
     fn set_formatter_spec(&self, fmt: Option<String>, datefmt: Option<String>) -> PyResult<()> {
         match fmt {
@@ -396,7 +425,8 @@ impl PyHTTPHandler {
         transform_callback=None,
         context_provider=None,
         error_callback=None,
-        overflow="block"
+        overflow="block",
+        tcp_nodelay=true
     ))]
     #[allow(clippy::too_many_arguments)]
     fn new(
@@ -411,6 +441,7 @@ impl PyHTTPHandler {
         context_provider: Option<Py<PyAny>>,
         error_callback: Option<Py<PyAny>>,
         overflow: &str,
+        tcp_nodelay: bool,
     ) -> PyResult<Self> {
         let h_map = headers.unwrap_or_default();
 
@@ -434,6 +465,7 @@ impl PyHTTPHandler {
             context_provider: context_provider.map(|cb| cb.clone_ref(py)),
             error_callback: error_callback.map(|cb| cb.clone_ref(py)),
             overflow: OverflowStrategy::from_overflow_str(overflow),
+            tcp_nodelay,
         };
 
         let h = HTTPHandler::with_config(config, capacity, batch_size, flush_interval);
@@ -495,6 +527,15 @@ impl PyHTTPHandler {
         self.inner.emit(&rust_record);
         Ok(())
     }
+
+    /// Emit an iterable of records in a single call across the Python boundary.
+    fn batch_emit(&self, records: &Bound<PyAny>) -> PyResult<()> {
+        for record in records.try_iter()? {
+            let rust_record = record?.extract::<LogRecord>()?;
+            self.inner.emit(&rust_record);
+        }
+        Ok(())
+    }
 }
 
 #[pyclass(name = "OTLPHandler", subclass)]
@@ -517,7 +558,8 @@ impl PyOTLPHandler {
         batch_size=1000,
         flush_interval=30,
         error_callback=None,
-        overflow="block"
+        overflow="block",
+        tcp_nodelay=true
     ))]
     #[allow(clippy::too_many_arguments)]
     fn new(
@@ -530,6 +572,7 @@ impl PyOTLPHandler {
         flush_interval: u64,
         error_callback: Option<Py<PyAny>>,
         overflow: &str,
+        tcp_nodelay: bool,
     ) -> PyResult<Self> {
         let h_map = headers.unwrap_or_default();
 
@@ -539,6 +582,7 @@ impl PyOTLPHandler {
             service_name,
             error_callback: error_callback.map(|cb| cb.clone_ref(py)),
             overflow: OverflowStrategy::from_overflow_str(overflow),
+            tcp_nodelay,
         };
 
         let h = OTLPHandler::with_config(config, capacity, batch_size, flush_interval);
@@ -584,6 +628,15 @@ impl PyOTLPHandler {
         self.inner.emit(&rust_record);
         Ok(())
     }
+
+    /// Emit an iterable of records in a single call across the Python boundary.
+    fn batch_emit(&self, records: &Bound<PyAny>) -> PyResult<()> {
+        for record in records.try_iter()? {
+            let rust_record = record?.extract::<LogRecord>()?;
+            self.inner.emit(&rust_record);
+        }
+        Ok(())
+    }
 }
 
 #[pyclass(name = "MemoryHandler", subclass)]
@@ -593,7 +646,7 @@ pub struct PyMemoryHandler {
 
 impl Default for PyMemoryHandler {
     fn default() -> Self {
-        Self::new()
+        Self::new(None)
     }
 }
 
@@ -604,10 +657,14 @@ impl Drop for PyMemoryHandler {
 #[pymethods]
 impl PyMemoryHandler {
     #[new]
-    pub fn new() -> Self {
-        Self {
-            inner: Arc::new(MemoryHandler::new()),
+    #[pyo3(signature = (capacity=None))]
+    pub fn new(capacity: Option<usize>) -> PyResult<Self> {
+        if capacity == Some(0) {
+            return Err(PyValueError::new_err("capacity must be at least 1"));
         }
+        Ok(Self {
+            inner: Arc::new(MemoryHandler::with_capacity(capacity)),
+        })
     }
 
     /// Returns all captured log records.
@@ -641,6 +698,12 @@ impl PyMemoryHandler {
         self.inner.clear();
     }
 
+    /// Changes whenever records are added or cleared; lets callers cache views.
+    #[getter]
+    pub fn version(&self) -> u64 {
+        self.inner.version()
+    }
+
     #[pyo3(name = "setLevel")]
     pub fn set_level(&self, py: Python, level: &Bound<PyAny>) -> PyResult<()> {
         let level_int = check_level(py, level)?;
@@ -662,4 +725,13 @@ impl PyMemoryHandler {
         self.inner.emit(&rust_record);
         Ok(())
     }
+
+    /// Emit an iterable of records in a single call across the Python boundary.
+    pub fn batch_emit(&self, records: &Bound<PyAny>) -> PyResult<()> {
+        for record in records.try_iter()? {
+            let rust_record = record?.extract::<LogRecord>()?;
+            self.inner.emit(&rust_record);
+        }
+        Ok(())
+    }
 }
@@ -786,7 +786,7 @@ impl PyLogger {
     }
 
     #[getter]
-    fn root(&self, py: Python) -> PyResult<PyLogger> {
+    fn root(&self, py: Python) -> PyResult<Py<PyLogger>> {
         crate::globals::get_logger(py, Some("root"), None)
     }
 
@@ -817,6 +817,14 @@ impl PyLogger {
         Ok(self.fast_logger.get_effective_level())
     }
 
+    /// Return `(effective_level, name)` in one call, for Python-side caches.
+    fn get_cache_state(&self) -> PyResult<(u32, String)> {
+        Ok((
+            self.fast_logger.get_effective_level(),
+            self.fast_logger.name.to_string(),
+        ))
+    }
+
     fn addHandler(&self, _py: Python, handler: &Bound<PyAny>) -> PyResult<()> {
         add_handler_to_registry(
             handler,
@@ -1108,7 +1116,7 @@ impl PyLogger {
     }
 
     #[pyo3(signature = (suffix))]
-    fn getChild(slf: PyRef<Self>, py: Python, suffix: &str) -> PyResult<PyLogger> {
+    fn getChild(slf: PyRef<Self>, py: Python, suffix: &str) -> PyResult<Py<PyLogger>> {
         let logger_name = if slf.fast_logger.name.is_empty() {
             suffix.to_string()
         } else {
@@ -1119,8 +1127,6 @@ impl PyLogger {
 
     #[pyo3(signature = (level))]
     fn isEnabledFor(&self, level: u32) -> PyResult<bool> {
-        Ok(self
-            .fast_logger
-            .is_enabled_for(LogLevel::from_usize(level as usize)))
+        Ok(self.fast_logger.is_enabled_for_level(level))
     }
 }
@@ -0,0 +1,96 @@
+"""
+Tests for the pure-Python compatibility Formatter in logxide.compat_handlers.
+
+Records reach this formatter either as dicts (built by the Rust filter/dispatch path)
+or as LogRecord-like objects (user code), so each behaviour is checked for both shapes.
+"""
+
+import time
+
+from logxide.compat_handlers import Formatter, LogRecord
+
+
+def _record(msg="hello %s", args=("world",)):
+    return LogRecord("compat.test", 20, "/tmp/mod.py", 7, msg, args, None)
+
+
+def test_default_fmt_renders_message_from_logrecord():
+    formatter = Formatter()
+    assert formatter.format(_record()) == "hello world"
+
+
+def test_default_fmt_renders_message_from_dict():
+    formatter = Formatter("%(message)s")
+    assert formatter.format({"msg": "plain", "levelno": 20}) == "plain"
+    assert formatter.format({"msg": "raw", "message": "rendered"}) == "rendered"
+
+
+def test_default_fmt_stringifies_non_str_messages():
+    formatter = Formatter()
+    assert formatter.format({"msg": 42}) == "42"
+
+
+def test_custom_fmt_still_interpolates():
+    formatter = Formatter("%(levelname)s:%(name)s:%(message)s")
+    assert formatter.format(_record()) == "INFO:compat.test:hello world"
+
+
+def test_reassigned_fmt_is_used():
+    formatter = Formatter()
+    formatter.fmt = "%(name)s - %(message)s"
+    assert formatter.format(_record()) == "compat.test - hello world"
+    formatter.fmt = "%(message)s"
+    assert formatter.format({"name": "compat.dict", "msg": "bare"}) == "bare"
+
+
+def test_format_populates_message_on_the_record():
+    formatter = Formatter("%(name)s - %(message)s")
+    record = {"name": "compat.dict", "msg": "from rust"}
+    assert formatter.format(record) == "compat.dict - from rust"
+    # Like stdlib, formatting stores the rendered message on the record itself.
+    assert record["message"] == "from rust"
+
+
+def test_format_adds_asctime_only_when_referenced():
+    record = {"name": "compat.dict", "msg": "m", "created": 0.0, "msecs": 0}
+    Formatter("%(message)s!").format(record)
+    assert "asctime" not in record
+    Formatter("%(asctime)s %(message)s").format(record)
+    assert "asctime" in record
+
+
+def test_asctime_in_fmt_set_after_init_is_filled_in():
+    class LateFormatter(Formatter):
+        def __init__(self):
+            super().__init__()
+            self.fmt = "%(asctime)s %(message)s"
+
+    record = {"name": "compat.dict", "msg": "m", "created": 0.0, "msecs": 0}
+    assert LateFormatter().format(record) == record["asctime"] + " m"
+    assert LateFormatter().format(_record()).endswith(" hello world")
+
+
+def test_format_time_zero_pads_milliseconds():
+    formatter = Formatter()
+    stamp = formatter.formatTime({"created": 0.0, "msecs": 7.9})
+    assert stamp.endswith(",007")
+    assert formatter.formatTime({"created": 0.0, "msecs": 999.99}).endswith(",999")
+
+
+def test_format_time_matches_localtime_within_and_across_seconds():
+    formatter = Formatter()
+    for created in (1000.1, 1000.9, 1001.0, -0.5):
+        expected = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created))
+        assert formatter.formatTime({"created": created, "msecs": 0}) == (
+            expected + ",000"
+        )
+
+
+def test_format_accepts_records_without_instance_dict():
+    class SlottedRecord:
+        __slots__ = ("msg",)
+
+        def __init__(self, msg):
+            self.msg = msg
+
+    assert Formatter("%(message)s!").format(SlottedRecord("slotted")) == "slotted!"
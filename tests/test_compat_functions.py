@@ -143,6 +143,14 @@ class TestMakeLogRecord:
         # Should not raise an exception
         assert record is not None
 
+    def test_makeLogRecord_reuses_record_class(self):
+        """Test that records share one class rather than one class per call."""
+        first = makeLogRecord({"msg": "a"})
+        second = makeLogRecord({"msg": "b"})
+
+        assert type(first) is type(second)
+        assert (first.msg, second.msg) == ("a", "b")
+
 
 class TestLogRecordFactory:
     """Test log record factory functions."""
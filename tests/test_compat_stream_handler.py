@@ -0,0 +1,134 @@
+"""
+Tests for the pure-Python compatibility StreamHandler in logxide.compat_handlers.
+"""
+
+import io
+import time
+import types
+
+from logxide.compat_handlers import ERROR, INFO, Formatter, StreamHandler
+
+
+def _record(msg, levelno=INFO):
+    return {"name": "compat.stream", "msg": msg, "levelno": levelno}
+
+
+def test_unbuffered_handler_writes_each_record():
+    stream = io.StringIO()
+    handler = StreamHandler(stream)
+    handler.handle(_record("one"))
+    assert stream.getvalue() == "one\n"
+
+
+def test_unbuffered_handler_close_and_flush():
+    stream = io.StringIO()
+    handler = StreamHandler(stream)
+    handler.flush()
+    handler.close()
+    handler.handle(_record("after close"))
+    assert stream.getvalue() == "after close\n"
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_buffered_handler_batches_until_threshold():
+    stream = io.StringIO()
+    handler = StreamHandler(stream, buffer_size=10, flush_interval=60)
+    handler.handle(_record("abc"))
+    handler.handle(_record("def"))
+    assert stream.getvalue() == ""
+    handler.handle(_record("ghi"))
+    # The writer thread picks the batch up once the threshold is crossed.
+    assert _wait_for(lambda: stream.getvalue() == "abc\ndef\nghi\n")
+    handler.close()
+
+
+def test_buffered_handler_drains_on_interval():
+    stream = io.StringIO()
+    handler = StreamHandler(stream, buffer_size=4096, flush_interval=0.05)
+    handler.handle(_record("idle"))
+    assert _wait_for(lambda: stream.getvalue() == "idle\n")
+    handler.close()
+
+
+def test_buffered_handler_writes_errors_immediately():
+    stream = io.StringIO()
+    handler = StreamHandler(stream, buffer_size=4096)
+    handler.handle(_record("context"))
+    handler.handle(_record("boom", ERROR))
+    assert stream.getvalue() == "context\nboom\n"
+
+
+def test_flush_and_set_stream_drain_pending_records():
+    first, second = io.StringIO(), io.StringIO()
+    handler = StreamHandler(first, buffer_size=4096)
+    handler.handle(_record("pending"))
+    handler.setStream(second)
+    assert first.getvalue() == "pending\n"
+    handler.handle(_record("later"))
+    handler.flush()
+    assert second.getvalue() == "later\n"
+
+
+def test_formatter_is_used_whether_set_or_assigned():
+    stream = io.StringIO()
+    handler = StreamHandler(stream)
+    handler.setFormatter(Formatter("[%(name)s] %(message)s"))
+    handler.handle(_record("set"))
+    handler.formatter = Formatter("<%(message)s>")
+    handler.handle(_record("assigned"))
+    handler.formatter = None
+    handler.handle(_record("bare"))
+    assert stream.getvalue() == "[compat.stream] set\n<assigned>\nbare\n"
+
+
+def test_stream_assignment_rebinds_write_and_flush():
+    first, second = io.StringIO(), io.StringIO()
+    handler = StreamHandler(first)
+    handler.stream = second
+    handler.handle(_record("moved"))
+    assert first.getvalue() == ""
+    assert second.getvalue() == "moved\n"
+
+
+def test_closed_buffered_handler_writes_synchronously():
+    stream = io.StringIO()
+    handler = StreamHandler(stream, buffer_size=4096, flush_interval=60)
+    handler.handle(_record("before"))
+    handler.close()
+    assert stream.getvalue() == "before\n"
+    handler.handle(_record("after"))
+    assert stream.getvalue() == "before\nafter\n"
+
+
+def test_dead_buffered_handler_writes_behind_queued_records():
+    stream = io.StringIO()
+    handler = StreamHandler(stream, buffer_size=1024, flush_interval=60)
+    handler.handle(_record("queued"))
+    # As at interpreter exit: marked dead before the queue was drained.
+    handler._dead = True
+    handler.handle(_record("direct"))
+    assert stream.getvalue() == "queued\ndirect\n"
+
+
+def test_handle_drops_records_below_handler_level():
+    stream = io.StringIO()
+    handler = StreamHandler(stream)
+    handler.setLevel(ERROR)
+    assert handler.handle(_record("quiet")) is False
+    assert handler.handle(_record("loud", ERROR))
+    assert stream.getvalue() == "loud\n"
+
+
+def test_handle_treats_record_without_levelno_as_notset():
+    stream = io.StringIO()
+    handler = StreamHandler(stream)
+    handler.setLevel(ERROR)
+    assert handler.handle({"name": "compat.stream", "msg": "bare"}) is False
+    assert handler.handle(types.SimpleNamespace(msg="bare")) is False
+    assert stream.getvalue() == ""
@@ -6,6 +6,25 @@ def test_module_level_logging():
     logging.info("test_module_level_logging")
 
 
+def test_module_level_helpers_rebound_after_uninstall():
+    from logxide import module_system
+
+    logging.info("bind the module-level helpers")
+    assert "info" in vars(logging)
+
+    was_installed = module_system._installed
+    module_system.uninstall()
+    try:
+        for name in module_system._ROOT_METHODS:
+            assert name not in vars(logging)
+    finally:
+        if was_installed:
+            module_system._install()
+
+    logging.info("rebind the module-level helpers")
+    assert vars(logging)["info"] == logging.getLogger().info
+
+
 def test_exception_logging():
     try:
         raise ValueError("test")
@@ -0,0 +1,136 @@
+"""
+Tests for FastLoggerWrapper, the Python-side level gate in front of the Rust PyLogger.
+"""
+
+import pytest
+
+from logxide import logxide as _ext
+from logxide.fast_logger_wrapper import DEBUG, ERROR, INFO, WARNING, FastLoggerWrapper
+from logxide.handlers import MemoryHandler
+
+
+def _wrapped(name, level=WARNING):
+    rust_logger = _ext.logging.getLogger(name)
+    rust_logger.setLevel(level)
+    return FastLoggerWrapper(rust_logger)
+
+
+def test_cached_state_mirrors_rust_logger():
+    wrapper = _wrapped("flw.cache", INFO)
+    assert wrapper.getEffectiveLevel() == INFO
+    assert wrapper._name == "flw.cache"
+    assert wrapper.isEnabledFor(INFO)
+    assert not wrapper.isEnabledFor(DEBUG)
+
+
+def test_set_level_refreshes_cache():
+    wrapper = _wrapped("flw.set_level", WARNING)
+    wrapper.setLevel(DEBUG)
+    assert wrapper.getEffectiveLevel() == DEBUG
+    assert wrapper.isEnabledFor(DEBUG)
+
+
+def test_log_accepts_level_names_in_any_case():
+    wrapper = _wrapped("flw.names", INFO)
+    handler = MemoryHandler()
+    wrapper.addHandler(handler)
+    try:
+        wrapper.log("DEBUG", "dropped")
+        wrapper.log("info", "kept info")
+        wrapper.log("Warning", "kept warning")
+        assert [r[1:] for r in handler.record_tuples] == [
+            (INFO, "kept info"),
+            (WARNING, "kept warning"),
+        ]
+    finally:
+        wrapper.removeHandler(handler)
+
+
+def test_level_methods_drop_disabled_records():
+    wrapper = _wrapped("flw.gate", WARNING)
+    handler = MemoryHandler()
+    wrapper.addHandler(handler)
+    try:
+        wrapper.debug("dropped")
+        wrapper.info("dropped")
+        wrapper.warning("kept")
+        wrapper.error("kept too")
+        assert [r[2] for r in handler.record_tuples] == ["kept", "kept too"]
+    finally:
+        wrapper.removeHandler(handler)
+
+
+def test_log_if_only_builds_enabled_messages():
+    wrapper = _wrapped("flw.log_if", INFO)
+    handler = MemoryHandler()
+    wrapper.addHandler(handler)
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return "built"
+
+    try:
+        wrapper.log_if(DEBUG, factory)
+        assert calls == []
+        wrapper.log_if(INFO, factory)
+        assert calls == [1]
+        assert [r[2] for r in handler.record_tuples] == ["built"]
+    finally:
+        wrapper.removeHandler(handler)
+
+
+def test_common_attributes_are_cached_and_refreshed():
+    wrapper = _wrapped("flw.attrs", INFO)
+    assert wrapper.propagate is True
+    assert wrapper.disabled is False
+    assert wrapper.handlers == []
+    wrapper.propagate = False
+    try:
+        assert wrapper.propagate is False
+        assert wrapper._rust_logger.propagate is False
+    finally:
+        wrapper.propagate = True
+
+
+def test_cache_refresh_errors_propagate():
+    class Broken:
+        def get_cache_state(self):
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        FastLoggerWrapper(Broken())
+
+
+def test_ancestor_level_change_invalidates_cache():
+    parent = _ext.logging.getLogger("flw.generation")
+    parent.setLevel(WARNING)
+    child = _ext.logging.getLogger("flw.generation.child")
+    child.setLevel(0)
+    wrapper = FastLoggerWrapper(child)
+    assert not wrapper.isEnabledFor(INFO)
+    # Changed on the Rust logger directly, never through the wrapper.
+    parent.setLevel(INFO)
+    assert wrapper.isEnabledFor(INFO)
+    assert wrapper.getEffectiveLevel() == INFO
+
+
+def test_level_methods_follow_ancestor_level_changes():
+    parent = _ext.logging.getLogger("flw.ancestor")
+    parent.setLevel(WARNING)
+    child = _ext.logging.getLogger("flw.ancestor.child")
+    child.setLevel(0)
+    wrapper = FastLoggerWrapper(child)
+    handler = MemoryHandler()
+    wrapper.addHandler(handler)
+    try:
+        wrapper.info("dropped")
+        # Lowered on the Rust logger directly, never through the wrapper.
+        parent.setLevel(INFO)
+        wrapper.info("kept")
+        parent.setLevel(ERROR)
+        wrapper.warning("dropped again")
+        assert [r[2] for r in handler.record_tuples] == ["kept"]
+    finally:
+        wrapper.removeHandler(handler)
+        parent.setLevel(WARNING)
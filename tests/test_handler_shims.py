@@ -0,0 +1,147 @@
+"""
+Tests for the stdlib-compatible handler shims in logxide.handlers.
+
+The shims subclass the stdlib handlers so isinstance() checks keep working, while the
+actual I/O is done by the Rust handler in ``_inner``.
+"""
+
+import logging
+import logging.handlers
+import os
+import sys
+import time
+
+import pytest
+
+from logxide import handlers
+
+
+def _no_python_open(self):
+    raise AssertionError("the shim must not open the file from Python")
+
+
+def test_file_handler_sets_stdlib_attributes_without_opening(tmp_path, monkeypatch):
+    monkeypatch.setattr(logging.FileHandler, "_open", _no_python_open)
+    path = tmp_path / "shim.log"
+    handler = handlers.FileHandler(path, encoding="utf-8")
+    try:
+        assert isinstance(handler, logging.FileHandler)
+        assert handler.baseFilename == os.path.abspath(path)
+        assert handler.mode == "a"
+        assert handler.encoding == "utf-8"
+        assert handler.stream is None
+    finally:
+        handler.close()
+
+
+def test_file_handler_output_reaches_disk_without_flush(tmp_path):
+    path = tmp_path / "unflushed.log"
+    handler = handlers.FileHandler(path)
+    try:
+        handler.handle(
+            logging.LogRecord(
+                "shim.file", logging.INFO, __file__, 1, "quiet", None, None
+            )
+        )
+        deadline = time.monotonic() + 5
+        while "quiet" not in path.read_text() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert "quiet" in path.read_text()
+    finally:
+        handler.close()
+
+
+def test_rotating_file_handler_sets_stdlib_attributes_without_opening(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(logging.FileHandler, "_open", _no_python_open)
+    path = tmp_path / "rotating.log"
+    handler = handlers.RotatingFileHandler(
+        str(path), mode="w", maxBytes=1024, backupCount=3
+    )
+    try:
+        assert isinstance(handler, logging.handlers.RotatingFileHandler)
+        assert handler.baseFilename == os.path.abspath(path)
+        # stdlib forces append mode whenever rotation is enabled.
+        assert handler.mode == "a"
+        assert (handler.maxBytes, handler.backupCount) == (1024, 3)
+        assert handler.stream is None
+    finally:
+        handler.close()
+
+
+def test_shims_expose_rust_handler_methods(tmp_path):
+    handler = handlers.FileHandler(tmp_path / "delegate.log")
+    try:
+        assert handler.isNative() is True
+        # Resolved once, then served from the instance dict.
+        assert "isNative" in handler.__dict__
+        handler.addFilter(lambda record: True)
+        assert handler.isNative() is False
+    finally:
+        handler.close()
+
+
+def test_missing_attributes_still_raise():
+    handler = handlers.MemoryHandler()
+    assert not hasattr(handler, "no_such_attribute")
+
+
+def test_stream_handler_defaults_to_stderr():
+    handler = handlers.StreamHandler()
+    assert isinstance(handler, logging.StreamHandler)
+    assert handler.stream is sys.stderr
+    assert handlers.StreamHandler(sys.stdout).stream is sys.stdout
+
+
+def test_batch_emit_applies_level_and_filters():
+    handler = handlers.MemoryHandler()
+    handler.setLevel(logging.INFO)
+    handler.addFilter(lambda record: record.msg != "filtered")
+    records = [
+        logging.LogRecord("shim.batch", level, __file__, 1, msg, None, None)
+        for level, msg in (
+            (logging.DEBUG, "below level"),
+            (logging.INFO, "first"),
+            (logging.INFO, "filtered"),
+            (logging.ERROR, "second"),
+        )
+    ]
+    handler.batch_emit(records)
+    assert [r[2] for r in handler.record_tuples] == ["first", "second"]
+
+
+def test_memory_handler_capacity_keeps_newest_records():
+    handler = handlers.MemoryHandler(capacity=2)
+    for msg in ("first", "second", "third"):
+        handler.handle(
+            logging.LogRecord("shim.ring", logging.INFO, __file__, 1, msg, None, None)
+        )
+    assert [r[2] for r in handler.record_tuples] == ["second", "third"]
+
+
+def test_memory_handler_rejects_capacity_below_one():
+    for capacity in (0, -1):
+        with pytest.raises(ValueError):
+            handlers.MemoryHandler(capacity=capacity)
+
+
+def test_memory_handler_views_refresh_after_new_records():
+    handler = handlers.MemoryHandler()
+
+    def log(msg):
+        handler.handle(
+            logging.LogRecord("shim.views", logging.INFO, __file__, 1, msg, None, None)
+        )
+
+    log("one")
+    assert handler.text == handler.text
+    first = handler.record_tuples
+    first.append("mutated by caller")
+    assert [r[2] for r in handler.record_tuples] == ["one"]
+    log("two")
+    assert "two" in handler.text
+    assert [r[2] for r in handler.record_tuples] == ["one", "two"]
+    handler.clear()
+    assert handler.text == ""
+    assert handler.record_tuples == []
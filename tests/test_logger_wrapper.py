@@ -0,0 +1,109 @@
+"""
+Tests for logxide.logger_wrapper: the cached getLogger() and basicConfig() helpers.
+"""
+
+import types
+
+from logxide import logger_wrapper
+
+
+def test_get_logger_returns_cached_singletons():
+    first = logger_wrapper.getLogger("wrapper.cache")
+    assert logger_wrapper.getLogger("wrapper.cache") is first
+    assert logger_wrapper._logger_cache["wrapper.cache"] is first
+
+
+def test_get_logger_without_name_is_root():
+    assert logger_wrapper.getLogger() is logger_wrapper.getLogger("root")
+
+
+def test_get_logger_links_parents():
+    child = logger_wrapper.getLogger("wrapper.parent.child")
+    parent = logger_wrapper.getLogger("wrapper.parent")
+    assert child.parent.name == parent.name
+    assert logger_wrapper.getLogger("wrapper").parent.name == "root"
+
+
+def test_get_logger_creates_missing_ancestors_once():
+    leaf = logger_wrapper.getLogger("wrapper.deep.a.b.c")
+    names = ["wrapper.deep", "wrapper.deep.a", "wrapper.deep.a.b"]
+    assert all(name in logger_wrapper._logger_cache for name in names)
+    assert leaf.parent.name == "wrapper.deep.a.b"
+    assert logger_wrapper.getLogger("wrapper.deep.a.b").parent.name == "wrapper.deep.a"
+
+
+def test_is_enabled_for_compares_custom_levels_by_value():
+    logger = logger_wrapper.getLogger("wrapper.custom_levels")
+    logger.setLevel(20)
+    assert logger.isEnabledFor(25)
+    assert logger.isEnabledFor(60)
+    assert not logger.isEnabledFor(15)
+
+
+class _StubLogger:
+    def __init__(self, name):
+        self.name = name
+        self.handlers = [object()]
+        self.propagate = False
+
+
+def test_migrate_existing_loggers_only_visits_new_loggers(monkeypatch):
+    # A stand-in "logging" module: the suite may have replaced the real one.
+    logger_dict = {}
+    _StubLogger.manager = types.SimpleNamespace(loggerDict=logger_dict)
+    monkeypatch.setattr(
+        logger_wrapper, "_std_logging", types.SimpleNamespace(Logger=_StubLogger)
+    )
+
+    first = logger_dict["wrapper.migrate.first"] = _StubLogger("wrapper.migrate.first")
+    logger_wrapper._migrate_existing_loggers()
+    assert first.handlers == []
+    assert first.propagate is True
+
+    # Handlers added after migration survive a later incremental pass...
+    first.handlers.append("kept")
+    second = logger_dict["wrapper.migrate.second"] = _StubLogger(
+        "wrapper.migrate.second"
+    )
+    logger_wrapper._migrate_existing_loggers()
+    assert first.handlers == ["kept"]
+    assert second.handlers == []
+
+    # ...but force re-migrates every logger.
+    logger_wrapper._migrate_existing_loggers(force=True)
+    assert first.handlers == []
+
+
+def test_rust_get_logger_returns_the_registered_object():
+    rust_get_logger = logger_wrapper._rust_getLogger
+    logger = rust_get_logger("wrapper.rust_identity")
+    assert rust_get_logger("wrapper.rust_identity") is logger
+    assert logger.getChild("child") is rust_get_logger("wrapper.rust_identity.child")
+
+
+def test_basic_config_resolves_level_names_for_file_handler(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(
+        logger_wrapper.logxide.logging,
+        "register_file_handler",
+        lambda *args, **kwargs: calls.append((args, kwargs)),
+    )
+    monkeypatch.setattr(logger_wrapper.logxide.logging, "clear_handlers", lambda: None)
+    root = types.SimpleNamespace(setLevel=lambda level: None, handlers=[])
+    monkeypatch.setattr(logger_wrapper, "getLogger", lambda name=None: root)
+    monkeypatch.setattr(logger_wrapper, "_migrate_existing_loggers", lambda **kw: None)
+    monkeypatch.setattr(logger_wrapper, "_basic_config_called", False)
+    monkeypatch.setattr(logger_wrapper, "_current_config", {})
+
+    logger_wrapper.basicConfig(
+        filename=str(tmp_path / "app.log"), level="info", flush_level="ERROR"
+    )
+    logger_wrapper.basicConfig(
+        filename=str(tmp_path / "app.log"), force=True, flush_interval_ms=0
+    )
+
+    (args, kwargs), (_, default_kwargs) = calls
+    assert args[1] == 20
+    assert kwargs["flush_level"] == 40
+    assert default_kwargs == {"flush_level": 40, "flush_interval_ms": 0}
+    assert set(logger_wrapper._current_config) == {"level", "format", "datefmt"}
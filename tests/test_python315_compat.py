@@ -90,6 +90,76 @@ class TestLazyImportCompat:
         assert hasattr(mod, "config"), "logging.config should be accessible"
         assert hasattr(mod, "handlers"), "logging.handlers should be accessible"
 
+    def test_private_handler_state_is_created_on_first_access(self):
+        """Test that _lock/_handlers/_handlerList exist but are built lazily."""
+        from logxide import module_system
+
+        mod = module_system._LoggingModule()
+        assert "_handlers" not in vars(mod)
+        assert mod._handlers is mod._handlers
+        assert mod._handlerList == []
+        with mod._lock:
+            pass
+        assert not hasattr(mod, "_no_such_attribute")
+
+    def test_patched_getLogger_returns_cached_logger(self, monkeypatch):
+        """Test repeat stdlib getLogger() calls skip the original lookup."""
+        from logxide import module_system
+
+        # sys.modules["logging"] may already be the LogXide shim here.
+        std_logging = module_system._std_logging
+        was_installed = module_system._installed
+        module_system._install()
+        try:
+            first = std_logging.getLogger("test_patched_cache")
+
+            def original_getLogger(name=None):
+                raise AssertionError("cached logger should be returned")
+
+            monkeypatch.setattr(std_logging, "_original_getLogger", original_getLogger)
+            assert std_logging.getLogger("test_patched_cache") is first
+        finally:
+            monkeypatch.undo()
+            if not was_installed:
+                module_system.uninstall()
+
+    def test_patched_getLogger_rewraps_unwrapped_logger(self):
+        """Test a cached logger whose _logxide_pylogger was removed is re-wrapped."""
+        from logxide import module_system
+
+        std_logging = module_system._std_logging
+        was_installed = module_system._installed
+        module_system._install()
+        try:
+            first = std_logging.getLogger("test_patched_rewrap")
+            del first._logxide_pylogger
+
+            assert std_logging.getLogger("test_patched_rewrap") is first
+            assert hasattr(first, "_logxide_pylogger")
+        finally:
+            if not was_installed:
+                module_system.uninstall()
+
+    def test_patched_getLogger_follows_logger_registry(self, monkeypatch):
+        """Test a cached logger dropped from loggerDict is not returned."""
+        from logxide import module_system
+
+        std_logging = module_system._std_logging
+        logger_dict = std_logging.root.manager.loggerDict
+        was_installed = module_system._installed
+        module_system._install()
+        try:
+            first = std_logging.getLogger("test_patched_registry")
+            monkeypatch.delitem(logger_dict, "test_patched_registry")
+
+            second = std_logging.getLogger("test_patched_registry")
+            assert second is not first
+            assert logger_dict["test_patched_registry"] is second
+        finally:
+            monkeypatch.undo()
+            if not was_installed:
+                module_system.uninstall()
+
     def test_install_is_idempotent(self):
         """Test that calling _install() multiple times is safe."""
         from logxide.module_system import _install
@@ -290,6 +290,25 @@ class TestLogXideIntegrationUnit:
             _auto_configure_sentry()
             mock_auto_config.assert_called_once_with(None)
 
+    def test_auto_detection_skipped_until_sentry_sdk_imported(self):
+        """Test that auto-detection doesn't import an unused sentry_sdk."""
+        with (
+            patch.dict(sys.modules),
+            patch(
+                "logxide.sentry_integration.auto_configure_sentry"
+            ) as mock_auto_config,
+        ):
+            sys.modules.pop("sentry_sdk", None)
+
+            from logxide.module_system import _auto_configure_sentry
+
+            _auto_configure_sentry()
+            mock_auto_config.assert_not_called()
+
+            # An explicit request still goes through.
+            _auto_configure_sentry(True)
+            mock_auto_config.assert_called_once_with(True)
+
     def test_install_with_explicit_sentry_control(self):
         """Test install() with explicit Sentry control."""
         with patch(